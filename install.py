@@ -2,7 +2,6 @@
 """Installer script for OpenClaw Telegram Bot."""
 
 import os
-import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -16,6 +15,11 @@ class Installer:
     def __init__(self, project_dir: str = "."):
         self.project_dir = Path(project_dir).resolve()
         self.venv_dir = self.project_dir / ".venv"
+        # Resolve the venv layout once (Windows uses Scripts/ and .exe)
+        is_windows = os.name == "nt"
+        self.venv_bin = self.venv_dir / ("Scripts" if is_windows else "bin")
+        self.venv_python = self.venv_bin / ("python.exe" if is_windows else "python")
+        self.venv_pip = self.venv_bin / ("pip.exe" if is_windows else "pip")
         self.config_dir = self.project_dir / "config"
         self.data_dir = self.project_dir / "data"
         self.logs_dir = self.project_dir / "logs"
@@ -84,8 +88,9 @@ class Installer:
             print("  Virtual environment already exists")
             return True
         
+        # Skip venv's own pip seeding; install_dependencies bootstraps pip once
         result = subprocess.run(
-            [sys.executable, "-m", "venv", str(self.venv_dir)],
+            [sys.executable, "-m", "venv", "--without-pip", str(self.venv_dir)],
             capture_output=True,
             text=True,
         )
@@ -98,19 +103,24 @@ class Installer:
     
     def install_dependencies(self) -> bool:
         """Install required packages."""
-        pip_path = self.venv_dir / "bin" / "pip"
-        if not pip_path.exists():
-            pip_path = self.venv_dir / "Scripts" / "pip.exe"  # Windows
-        
-        # Upgrade pip first
-        subprocess.run(
-            [str(pip_path), "install", "--upgrade", "pip"],
-            capture_output=True,
-        )
+        # Bootstrap pip into a venv created with --without-pip
+        if not self.venv_pip.exists():
+            result = subprocess.run(
+                [str(self.venv_python), "-m", "ensurepip", "--upgrade", "--default-pip"],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                print(f"  Error: {result.stderr}")
+                return False
         
-        # Install package
+        # Upgrade pip and install package in a single pip run; "python -m pip"
+        # skips the pip launcher shim
         result = subprocess.run(
-            [str(pip_path), "install", "-e", str(self.project_dir)],
+            [
+                str(self.venv_python), "-m", "pip",
+                "install", "--upgrade", "pip", "-e", str(self.project_dir),
+            ],
             capture_output=True,
             text=True,
         )
@@ -130,7 +140,9 @@ class Installer:
         env_file = self.config_dir / ".env"
         
         if env_template.exists() and not env_file.exists():
-            shutil.copy(env_template, env_file)
+            import shutil
+
+            shutil.copyfile(env_template, env_file)
             print("  Created config/.env from template")
         
         return True
@@ -240,16 +252,18 @@ settings:
         """Update .env file with secrets."""
         lines = env_file.read_text().splitlines()
         
+        # Index the first KEY= line for each key in one pass
+        index = {}
+        for i, line in enumerate(lines):
+            if "=" in line:
+                index.setdefault(line.partition("=")[0], i)
+        
         for key, value in secrets.items():
-            # Find and replace existing line
-            found = False
-            for i, line in enumerate(lines):
-                if line.startswith(f"{key}="):
-                    lines[i] = f"{key}={value}"
-                    found = True
-                    break
-            
-            if not found:
+            i = index.get(key)
+            if i is not None:
+                lines[i] = f"{key}={value}"
+            else:
+                index[key] = len(lines)
                 lines.append(f"{key}={value}")
         
         env_file.write_text("\n".join(lines) + "\n")
@@ -264,7 +278,7 @@ After=network.target
 Type=simple
 User={os.getenv('USER', 'root')}
 WorkingDirectory={self.project_dir}
-ExecStart={self.venv_dir}/bin/python -m src.main
+ExecStart={self.venv_python} -m src.main
 Restart=on-failure
 RestartSec=10
 Environment=PYTHONUNBUFFERED=1
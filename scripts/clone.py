@@ -11,30 +11,86 @@ for deploying the bot on another system. The archive includes:
 The archive NEVER contains .env files or any files with API keys/tokens.
 """
 
-import argparse
+import contextlib
 import io
+import itertools
 import os
 import re
 import sys
-import tarfile
 import time
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+if TYPE_CHECKING:
+    import tarfile
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
-# Patterns that match real secret values (not placeholders)
+# Patterns that match real secret values (not placeholders). They are pure
+# ASCII, so they are compiled as bytes and run on raw file content.
 SECRET_PATTERNS: List[re.Pattern] = [
-    re.compile(r"gsk_[A-Za-z0-9]{20,}"),  # Groq API key pattern
-    re.compile(r"\d{10}:[A-Za-z0-9_-]{35}"),  # Telegram bot token pattern
+    re.compile(rb"gsk_[A-Za-z0-9]{20,}"),  # Groq API key pattern
+    re.compile(rb"\d{10}:[A-Za-z0-9_-]{35}"),  # Telegram bot token pattern
 ]
 
 # Placeholder values that should NOT be flagged as secrets
 PLACEHOLDER_SUFFIXES = {"_here", "_token_here", "_key_here", "your_", ""}
-PLACEHOLDER_PATTERN = re.compile(
-    r"(?:your_\w+_here|your_\w+|placeholder|example|changeme|\bx{3,}\b)",
-    re.IGNORECASE,
+
+# Placeholder markers are folded into SECRET_PATTERN as negative lookaheads,
+# each bounded to the candidate's own characters, so a regex hit is always a
+# real secret and no second placeholder pass is needed.
+_GROQ_PLACEHOLDER = rb"(?![A-Za-z0-9]*(?i:placeholder|example|changeme))"
+_TELEGRAM_PLACEHOLDER = (
+    rb"(?!(?i:"
+    rb"[A-Za-z0-9_-]{0,24}?placeholder"
+    rb"|[A-Za-z0-9_-]{0,28}?example"
+    rb"|[A-Za-z0-9_-]{0,27}?changeme"
+    rb"|[A-Za-z0-9_-]{0,29}?your_\w"
+    rb"|[A-Za-z0-9_-]{0,32}?(?<![A-Za-z0-9_])x{3,}(?:-|(?<=:[A-Za-z0-9_-]{35}))"
+    rb"))"
+)
+
+# All secret patterns fused into one alternation so content is scanned once
+SECRET_PATTERN: re.Pattern = re.compile(
+    rb"gsk_" + _GROQ_PLACEHOLDER + rb"[A-Za-z0-9]{20,}"
+    rb"|\d{10}:" + _TELEGRAM_PLACEHOLDER + rb"[A-Za-z0-9_-]{35}"
 )
 
+# Binary file types that never hold plain-text credentials; not scanned
+BINARY_EXTENSIONS: Set[str] = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".ico",
+    ".webp",
+    ".woff",
+    ".woff2",
+    ".pdf",
+    ".zip",
+    ".gz",
+}
+
+# Files larger than this are scanned in chunks of this size
+SCAN_CHUNK_SIZE = 2 * 1024 * 1024
+
+# Bytes carried over between chunks so a secret split across two still matches
+SCAN_CHUNK_OVERLAP = 4096
+
 # Files that are always excluded (by name)
 EXCLUDED_FILENAMES: Set[str] = {
     ".env",
@@ -79,6 +135,13 @@ SOURCE_DIRS: List[str] = [
     "assets",
 ]
 
+# gzip level for the clone archive. It is a one-shot deployment bundle, so
+# fast compression beats the last few percent of size (level 9 is the default).
+ARCHIVE_COMPRESSLEVEL = 1
+
+# Below this many files, scanning runs in-process (pool startup would dominate)
+PARALLEL_SCAN_MIN_FILES = 64
+
 # Default .env.template content
 ENV_TEMPLATE_CONTENT = """\
 # OpenClaw Telegram Bot - Environment Configuration
@@ -104,33 +167,125 @@ def file_contains_secrets(filepath: Path) -> bool:
     Returns:
         True if the file contains secret patterns, False otherwise.
     """
+    if not _is_scannable(filepath):
+        return False
+
     try:
-        content = filepath.read_text(errors="ignore")
-    except (OSError, UnicodeDecodeError):
+        with open(filepath, "rb") as f:
+            return _stream_contains_secrets(f)
+    except OSError:
         return False
 
-    return content_contains_secrets(content)
 
+def _is_scannable(filepath: Path) -> bool:
+    """Check whether a file is worth scanning for secrets.
 
-def content_contains_secrets(content: str) -> bool:
-    """Check if string content contains API keys, tokens, or other secrets.
+    Args:
+        filepath: Path to the file.
+
+    Returns:
+        False for known binary types, True otherwise.
+    """
+    return filepath.suffix.lower() not in BINARY_EXTENSIONS
+
+
+def _stream_contains_secrets(f: BinaryIO) -> bool:
+    """Scan a binary stream for secrets without reading it all into memory.
+
+    Reads SCAN_CHUNK_SIZE bytes at a time, rescanning the last
+    SCAN_CHUNK_OVERLAP bytes of each chunk with the next one.
+
+    Args:
+        f: Stream opened in binary mode.
+
+    Returns:
+        True if the stream contains secret patterns, False otherwise.
+    """
+    tail = b""
+    while True:
+        chunk = f.read(SCAN_CHUNK_SIZE)
+        if not chunk:
+            return False
+        window = tail + chunk
+        if content_contains_secrets(window):
+            return True
+        tail = window[-SCAN_CHUNK_OVERLAP:]
+
+
+def content_contains_secrets(content: Union[str, bytes]) -> bool:
+    """Check if content contains API keys, tokens, or other secrets.
 
     Scans for known secret patterns (Groq API keys, Telegram tokens) while
-    ignoring placeholder/template values.
+    ignoring placeholder/template values. Raw bytes are scanned directly;
+    text is encoded to UTF-8 first.
 
     Args:
-        content: Text content to scan.
+        content: Text or raw bytes to scan.
 
     Returns:
         True if the content contains secret patterns, False otherwise.
     """
-    for pattern in SECRET_PATTERNS:
-        for match in pattern.finditer(content):
-            matched_text = match.group(0)
-            # Skip if the match is inside a placeholder context
-            if not PLACEHOLDER_PATTERN.search(matched_text):
-                return True
-    return False
+    if isinstance(content, str):
+        content = content.encode("utf-8", errors="ignore")
+
+    # Cheap memchr-backed screen: every secret needs "gsk_" or a ":"
+    if b"gsk_" not in content and b":" not in content:
+        return False
+
+    return SECRET_PATTERN.search(content) is not None
+
+
+def _read_clean_file(
+    item: Tuple[Path, str],
+) -> Tuple[str, Optional[bytes], int, int]:
+    """Read a file once and scan the in-memory bytes for secrets.
+
+    The file is stat'ed through its open descriptor, so the caller can build
+    the tar header without touching the path again.
+
+    Args:
+        item: (absolute_path, archive_name) tuple from collect_files().
+
+    Returns:
+        Tuple of (archive_name, content, mode, mtime). Content is None if
+        the file contains secrets.
+    """
+    filepath, arcname = item
+    with open(filepath, "rb") as f:
+        st = os.fstat(f.fileno())
+        data = f.read()
+    # The bytes are in memory anyway, so binary types are scanned too; this
+    # is the only content scan archived files get
+    if content_contains_secrets(data):
+        return arcname, None, st.st_mode, int(st.st_mtime)
+    return arcname, data, st.st_mode, int(st.st_mtime)
+
+
+def _parallel_map(func: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+    """Apply a picklable function to every item, fanning out across processes.
+
+    Secret scanning is regex-bound and embarrassingly parallel, so large
+    batches are spread over a process pool. Small batches run serially since
+    spawning workers would cost more than the scan itself. Results are
+    yielded as they become available so callers can pipeline on them.
+
+    Args:
+        func: Module-level function to apply.
+        items: Inputs to process.
+
+    Yields:
+        Results in the same order as ``items``.
+    """
+    items = iter(items)
+    head = list(itertools.islice(items, PARALLEL_SCAN_MIN_FILES))
+    if len(head) < PARALLEL_SCAN_MIN_FILES:
+        yield from map(func, head)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        yield from pool.map(func, itertools.chain(head, items), chunksize=8)
 
 
 def should_exclude_path(rel_path: Path) -> bool:
@@ -154,47 +309,68 @@ def should_exclude_path(rel_path: Path) -> bool:
     return False
 
 
-def collect_files(project_dir: Path) -> List[Tuple[Path, str]]:
+def _walk_files(root: str) -> Iterator[str]:
+    """Recursively yield includable file paths under a directory in sorted order.
+
+    Uses os.scandir so file/dir type checks come from the directory listing
+    instead of a stat() per entry. Excluded directories are pruned before
+    descending, so trees like .venv or .git are never enumerated. Symlinked
+    directories are not followed.
+
+    Args:
+        root: Directory to walk.
+
+    Yields:
+        Absolute paths of regular files (including symlinks to files).
+    """
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        # Parent directories were already checked on the way down, so the
+        # entry's own name is all that is left to test
+        if should_exclude_path(Path(entry.name)):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_files(entry.path)
+        elif entry.is_file():
+            yield entry.path
+
+
+def collect_files(project_dir: Path) -> Iterator[Tuple[Path, str]]:
     """Collect all files to include in the archive.
 
+    Files are yielded lazily so export() can read and compress them while
+    the tree is still being walked.
+
     Args:
         project_dir: Root directory of the project.
 
-    Returns:
-        List of (absolute_path, archive_name) tuples.
+    Yields:
+        (absolute_path, archive_name) tuples.
     """
-    files: List[Tuple[Path, str]] = []
+    root_len = len(str(project_dir)) + 1
 
     # Add config files
     for config_file in CONFIG_FILES:
         filepath = project_dir / config_file
-        if filepath.exists() and filepath.is_file():
-            files.append((filepath, config_file))
+        if filepath.is_file():
+            yield filepath, config_file
 
     # Add top-level project files
     for project_file in PROJECT_FILES:
         filepath = project_dir / project_file
-        if filepath.exists() and filepath.is_file():
-            files.append((filepath, project_file))
+        if filepath.is_file():
+            yield filepath, project_file
 
     # Add source directories recursively
     for source_dir in SOURCE_DIRS:
         dir_path = project_dir / source_dir
-        if not dir_path.exists() or not dir_path.is_dir():
+        if not dir_path.is_dir():
             continue
 
-        for filepath in sorted(dir_path.rglob("*")):
-            if not filepath.is_file():
-                continue
-
-            rel_path = filepath.relative_to(project_dir)
-
-            if should_exclude_path(rel_path):
-                continue
-
-            files.append((filepath, str(rel_path)))
-
-    return files
+        for path in _walk_files(str(dir_path)):
+            yield Path(path), path[root_len:]
 
 
 def validate_no_secrets(archive_path: Path) -> List[str]:
@@ -208,7 +384,11 @@ def validate_no_secrets(archive_path: Path) -> List[str]:
     Returns:
         List of filenames that contain secrets (empty if clean).
     """
+    import tarfile
+
     violations: List[str] = []
+    member_names: List[str] = []
+    contents: List[bytes] = []
 
     with tarfile.open(archive_path, "r:gz") as tar:
         for member in tar.getmembers():
@@ -221,21 +401,71 @@ def validate_no_secrets(archive_path: Path) -> List[str]:
                 violations.append(f"{member.name} (excluded filename)")
                 continue
 
-            # Check content for text files
+            # Collect content for text files
             f = tar.extractfile(member)
             if f is None:
                 continue
 
             try:
-                content = f.read().decode("utf-8", errors="ignore")
-                if content_contains_secrets(content):
-                    violations.append(f"{member.name} (contains secret patterns)")
+                contents.append(f.read())
+                member_names.append(member.name)
             finally:
                 f.close()
 
+    # Scan collected payloads
+    flags = _parallel_map(content_contains_secrets, contents)
+    for member_name, has_secrets in zip(member_names, flags):
+        if has_secrets:
+            violations.append(f"{member_name} (contains secret patterns)")
+
     return violations
 
 
+@contextlib.contextmanager
+def _open_archive_writer(archive_path: Path) -> Iterator["tarfile.TarFile"]:
+    """Open a tar.gz archive for writing, compressing with pigz when available.
+
+    stdlib gzip is single-threaded; pigz produces the same gzip format using
+    every core. Falls back to tarfile's built-in gzip if pigz is not installed.
+
+    Args:
+        archive_path: Path of the archive to create.
+
+    Yields:
+        A TarFile ready for addfile() calls.
+
+    Raises:
+        RuntimeError: If pigz exits with an error.
+    """
+    import shutil
+    import subprocess
+    import tarfile
+
+    pigz = shutil.which("pigz")
+    if pigz is None:
+        with tarfile.open(
+            str(archive_path), "w:gz", compresslevel=ARCHIVE_COMPRESSLEVEL
+        ) as tar:
+            yield tar
+        return
+
+    with open(archive_path, "wb") as out:
+        proc = subprocess.Popen(
+            [pigz, f"-{ARCHIVE_COMPRESSLEVEL}", "-c"],
+            stdin=subprocess.PIPE,
+            stdout=out,
+        )
+        try:
+            with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                yield tar
+        finally:
+            proc.stdin.close()
+            returncode = proc.wait()
+
+    if returncode != 0:
+        raise RuntimeError(f"pigz exited with status {returncode}")
+
+
 class CloneExporter:
     """Exports OpenClaw project to a portable archive excluding secrets."""
 
@@ -262,8 +492,11 @@ class CloneExporter:
             Path to the created archive.
 
         Raises:
-            RuntimeError: If the archive fails secret validation.
+            RuntimeError: If a member written to the archive fails secret
+                validation.
         """
+        import tarfile
+
         if output_path is None:
             timestamp = time.strftime("%Y%m%d-%H%M%S")
             output_path = str(
@@ -272,48 +505,64 @@ class CloneExporter:
 
         archive_path = Path(output_path).resolve()
         archive_name = "openclaw"
+        prefix = f"{archive_name}/"
 
         print(f"📦 Creating clone archive: {archive_path.name}")
         print(f"   Source: {self.project_dir}")
         print()
 
-        # Collect files
-        files = collect_files(self.project_dir)
+        # Collect files, skipping the clone script's own output
+        files = (
+            (fp, arcname)
+            for fp, arcname in collect_files(self.project_dir)
+            if fp != archive_path
+        )
+
+        # Read and scan every file once; clean bytes go straight into the tar
+        payloads = _parallel_map(_read_clean_file, files)
 
         included: List[str] = []
         excluded: List[str] = []
+        violations: List[str] = []
 
-        with tarfile.open(str(archive_path), "w:gz") as tar:
-            # Add collected files (filtering out secrets)
-            for filepath, arcname in files:
-                full_arcname = f"{archive_name}/{arcname}"
+        with _open_archive_writer(archive_path) as tar:
 
-                # Skip the clone script's own output
-                if filepath == archive_path:
-                    continue
+            def add_member(info: "tarfile.TarInfo", data: bytes, scanned: bool) -> None:
+                # Validate every member as it is written rather than
+                # re-reading the finished archive. Collected files were
+                # already scanned by _read_clean_file (in the process pool),
+                # so only generated members need their bytes checked here.
+                if os.path.basename(info.name) in EXCLUDED_FILENAMES:
+                    violations.append(f"{info.name} (excluded filename)")
+                elif not scanned and content_contains_secrets(data):
+                    violations.append(f"{info.name} (contains secret patterns)")
+                tar.addfile(info, io.BytesIO(data))
+
+            # Add collected files (filtering out secrets)
+            for arcname, data, mode, mtime in payloads:
+                full_arcname = prefix + arcname
 
-                # Check for secrets in file content
-                if file_contains_secrets(filepath):
+                if data is None:
                     excluded.append(f"{arcname} (contains secrets)")
                     continue
 
-                tar.add(str(filepath), arcname=full_arcname)
+                info = tarfile.TarInfo(name=full_arcname)
+                info.size = len(data)
+                info.mtime = mtime
+                info.mode = mode & 0o777
+                add_member(info, data, scanned=True)
                 included.append(arcname)
 
             # Generate and add .env.template
             env_template_info = tarfile.TarInfo(
-                name=f"{archive_name}/config/.env.template"
+                name=prefix + "config/.env.template"
             )
             env_template_bytes = ENV_TEMPLATE_CONTENT.encode("utf-8")
             env_template_info.size = len(env_template_bytes)
             env_template_info.mtime = int(time.time())
-            tar.addfile(env_template_info, io.BytesIO(env_template_bytes))
+            add_member(env_template_info, env_template_bytes, scanned=False)
             included.append("config/.env.template (generated)")
 
-        # Validate the archive
-        print("🔍 Validating archive for secrets...")
-        violations = validate_no_secrets(archive_path)
-
         if violations:
             # Remove the tainted archive
             archive_path.unlink(missing_ok=True)
@@ -322,7 +571,7 @@ class CloneExporter:
                 f"Archive validation failed! Files with secrets found:\n  {violation_list}"
             )
 
-        print("✅ Archive validated - no secrets detected")
+        print("✅ Archive validated in-stream - no secrets detected")
         print()
 
         # Print summary
@@ -357,6 +606,8 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Export OpenClaw configuration to a portable archive (excluding secrets)."
     )
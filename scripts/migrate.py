@@ -10,21 +10,49 @@ Provides backup and restore functionality for complete system state:
 
 The backup NEVER includes .env files (secrets). A .env.template is generated instead.
 
+Archives are gzip-compressed by default. Give --output a .tar.zst name to
+write a zstd archive instead (requires the optional ``zstandard`` package),
+or a plain .tar name for an uncompressed archive that restores with zero-copy
+sendfile on Linux; restore detects the format from the file contents.
+
 Usage:
     python scripts/migrate.py --backup [--output path/to/backup.tar.gz]
     python scripts/migrate.py --restore path/to/backup.tar.gz [--skip-logs]
 """
 
 import argparse
+import contextlib
+import functools
 import hashlib
 import io
 import json
 import os
+import shutil
+import stat
 import sys
 import tarfile
+import tempfile
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union,
+)
+
+try:
+    import orjson  # Optional: much faster manifest (de)serialization
+except ImportError:
+    orjson = None
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    tomllib = None
+
+try:
+    import zstandard  # Optional: multi-threaded .tar.zst archives
+except ImportError:
+    zstandard = None
 
 
 # Files to back up (relative to project root)
@@ -40,6 +68,31 @@ DATA_FILES: List[str] = [
     "data/usage_stats.json",
 ]
 
+# Read size for streaming files through SHA-256, and the in-memory limit for
+# spooled file snapshots before they spill to a temporary file on disk
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Output suffixes that select zstd compression, the zstd frame magic used to
+# detect zstd archives on restore, and the compression level for writing
+ZSTD_SUFFIXES: Tuple[str, ...] = (".tar.zst", ".tzst")
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+ZSTD_LEVEL = 3
+
+# Output suffix that selects an uncompressed tar archive
+PLAIN_TAR_SUFFIX = ".tar"
+
+# Buffer size for the archive file itself, and the tarfile stream buffer
+# (128 blocks); both amortize per-call overhead across many small members
+ARCHIVE_BUFFER_SIZE = 1024 * 1024
+TAR_BUFSIZE = 128 * tarfile.BLOCKSIZE
+
+# Worker threads used to snapshot and hash files during backup
+BACKUP_WORKERS = min(4, os.cpu_count() or 1)
+
+# Total bytes of file snapshots kept in memory while a backup is assembled;
+# snapshots beyond this are spilled to one shared temporary file
+SNAPSHOT_MEMORY_BUDGET = 32 * 1024 * 1024
+
 # Default .env.template content
 ENV_TEMPLATE_CONTENT = """\
 # OpenClaw Telegram Bot - Environment Configuration
@@ -68,6 +121,27 @@ def compute_sha256(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+def compute_stream_sha256(fileobj: BinaryIO) -> str:
+    """Compute SHA-256 hex digest for a binary file object, streaming it.
+
+    Uses hashlib.file_digest (Python 3.11+), which runs OpenSSL's hash loop
+    without the GIL; falls back to a chunked update loop on older Pythons.
+
+    Args:
+        fileobj: Binary file object opened for reading.
+
+    Returns:
+        Hex-encoded SHA-256 digest string.
+    """
+    if hasattr(hashlib, "file_digest"):
+        return hashlib.file_digest(fileobj, "sha256").hexdigest()
+
+    h = hashlib.sha256()
+    for chunk in iter(lambda: fileobj.read(HASH_CHUNK_SIZE), b""):
+        h.update(chunk)
+    return h.hexdigest()
+
+
 def compute_file_sha256(filepath: Path) -> str:
     """Compute SHA-256 hex digest for a file on disk.
 
@@ -77,7 +151,283 @@ def compute_file_sha256(filepath: Path) -> str:
     Returns:
         Hex-encoded SHA-256 digest string.
     """
-    return compute_sha256(filepath.read_bytes())
+    with open(filepath, "rb") as f:
+        return compute_stream_sha256(f)
+
+
+def dump_manifest(manifest: Dict[str, Any]) -> bytes:
+    """Serialize a manifest to indented JSON bytes.
+
+    Args:
+        manifest: Manifest dict.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    return json.dumps(manifest, indent=2).encode("utf-8")
+
+
+def load_manifest(data: bytes) -> Dict[str, Any]:
+    """Parse manifest JSON bytes.
+
+    Args:
+        data: UTF-8 encoded JSON.
+
+    Returns:
+        Parsed manifest dict.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass
+class ArchiveSlice:
+    """Location of a file's bytes inside another open file.
+
+    Used for members of an uncompressed tar archive on restore, and for
+    snapshots spilled to disk on backup.
+    """
+
+    source: BinaryIO
+    offset: int
+    size: int
+
+
+# Retained contents of a scanned archive member: a staged .part file, or its
+# location in an uncompressed archive
+MemberData = Union[Path, ArchiveSlice]
+
+# A file captured for backup: (contents, SHA-256 hex digest, mtime). Contents
+# are an in-memory snapshot or a slice of the shared spill file
+Snapshot = Tuple[Union[BinaryIO, ArchiveSlice], str, int]
+
+
+def is_uncompressed_tar(archive_path: Path) -> bool:
+    """Check whether an archive is a plain (uncompressed) tar file.
+
+    Args:
+        archive_path: Path to the archive.
+
+    Returns:
+        True if the first header block carries the ustar magic.
+    """
+    with open(archive_path, "rb") as f:
+        header = f.read(tarfile.BLOCKSIZE)
+    return header[257:262] == b"ustar"
+
+
+def _copy_range(
+    src: BinaryIO, offset: int, size: int, dst: BinaryIO
+) -> None:
+    """Copy a byte range of one file into another.
+
+    Uses os.sendfile so the kernel moves the data without it passing
+    through Python; falls back to a chunked read/write copy where sendfile
+    is unavailable or refuses the file types (e.g. macOS needs a socket).
+
+    Args:
+        src: Source file, opened for reading.
+        offset: Start offset of the range in src.
+        size: Number of bytes to copy.
+        dst: Destination file, opened for writing and positioned at the
+             point to copy to.
+    """
+    if hasattr(os, "sendfile"):
+        dst.flush()
+        start = offset
+        try:
+            while size > 0:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, size)
+                if sent == 0:
+                    raise EOFError("Unexpected end of archive")
+                offset += sent
+                size -= sent
+            return
+        except OSError:
+            # Only fall back if sendfile was refused outright
+            if offset != start:
+                raise
+
+    src.seek(offset)
+    while size > 0:
+        chunk = src.read(min(size, HASH_CHUNK_SIZE))
+        if not chunk:
+            raise EOFError("Unexpected end of archive")
+        dst.write(chunk)
+        size -= len(chunk)
+
+
+def _walk_files(root: str) -> Iterator[str]:
+    """Recursively yield file paths under a directory in sorted order.
+
+    Uses os.scandir so file/dir type checks come from the directory listing
+    instead of a stat() per entry. Symlinked directories are not followed.
+
+    Args:
+        root: Directory to walk.
+
+    Yields:
+        Paths of regular files (including symlinks to files).
+    """
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_files(entry.path)
+        elif entry.is_file():
+            yield entry.path
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve disk space for a file about to be written sequentially.
+
+    Lets the filesystem allocate contiguous extents up front instead of
+    block by block. Best effort: a no-op where posix_fallocate is missing
+    (macOS, Windows) or unsupported by the filesystem.
+
+    Args:
+        fd: File descriptor open for writing.
+        size: Final size of the file in bytes.
+    """
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        pass
+
+
+def _fsync_path(path: Path) -> Optional[str]:
+    """fsync a file or directory by path.
+
+    Args:
+        path: File or directory to flush to disk.
+
+    Returns:
+        Error message if the sync failed, otherwise None.
+    """
+    try:
+        # Windows only allows fsync on handles opened for writing
+        fd = os.open(path, os.O_RDWR if os.name == "nt" else os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        return f"{path}: fsync failed: {e}"
+    return None
+
+
+def _bounded_map(
+    func: Callable[[Any], Any], items: List[Any], workers: int
+) -> Iterator[Any]:
+    """Map func over items on a thread pool, yielding results in order.
+
+    At most ``2 * workers`` calls are in flight at once, so results that
+    hold resources (such as spooled snapshots) do not pile up ahead of the
+    consumer.
+
+    Args:
+        func: Callable to apply to each item.
+        items: Items to process.
+        workers: Number of worker threads.
+
+    Yields:
+        func(item) for each item, in input order.
+    """
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        for item in items:
+            pending.append(pool.submit(func, item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+@contextlib.contextmanager
+def open_archive_writer(archive_path: Path) -> Iterator[tarfile.TarFile]:
+    """Open a backup archive for writing, picking the codec from its suffix.
+
+    ``.tar.zst``/``.tzst`` archives are written as a tar stream through a
+    multi-threaded zstd compressor, ``.tar`` archives are left uncompressed,
+    and anything else is written as gzip.
+
+    Args:
+        archive_path: Destination path for the archive.
+
+    Yields:
+        TarFile open for writing.
+
+    Raises:
+        RuntimeError: If a zstd archive is requested but zstandard is missing.
+    """
+    use_zstd = archive_path.name.endswith(ZSTD_SUFFIXES)
+    if use_zstd and zstandard is None:
+        raise RuntimeError(
+            "Writing .tar.zst archives requires the 'zstandard' package"
+        )
+
+    with open(archive_path, "wb", buffering=ARCHIVE_BUFFER_SIZE) as raw:
+        if not use_zstd:
+            plain = archive_path.name.endswith(PLAIN_TAR_SUFFIX)
+            with tarfile.open(
+                fileobj=raw, mode="w|" if plain else "w|gz", bufsize=TAR_BUFSIZE
+            ) as tar:
+                yield tar
+            return
+
+        cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+        with cctx.stream_writer(raw, closefd=False) as zf, tarfile.open(
+            fileobj=zf, mode="w|", bufsize=TAR_BUFSIZE
+        ) as tar:
+            yield tar
+
+
+@contextlib.contextmanager
+def open_archive_reader(archive_path: Path) -> Iterator[tarfile.TarFile]:
+    """Open a backup archive as a forward-only tar stream.
+
+    zstd archives are detected by their frame magic; anything else is read
+    with tarfile's transparent decompression (gzip for legacy backups).
+    Members must be consumed in archive order.
+
+    Args:
+        archive_path: Path to the archive.
+
+    Yields:
+        TarFile open in streaming read mode.
+
+    Raises:
+        RuntimeError: If the archive is zstd but zstandard is missing.
+    """
+    with open(archive_path, "rb", buffering=ARCHIVE_BUFFER_SIZE) as raw:
+        is_zstd = raw.peek(len(ZSTD_MAGIC))[: len(ZSTD_MAGIC)] == ZSTD_MAGIC
+
+        if not is_zstd:
+            with tarfile.open(
+                fileobj=raw, mode="r|*", bufsize=TAR_BUFSIZE
+            ) as tar:
+                yield tar
+            return
+
+        if zstandard is None:
+            raise RuntimeError(
+                "Reading .tar.zst archives requires the 'zstandard' package"
+            )
+
+        dctx = zstandard.ZstdDecompressor()
+        with dctx.stream_reader(raw, closefd=False) as zf, tarfile.open(
+            fileobj=zf, mode="r|", bufsize=TAR_BUFSIZE
+        ) as tar:
+            yield tar
 
 
 class MigrationManager:
@@ -102,7 +452,8 @@ class MigrationManager:
         for integrity validation. Never includes .env (secrets).
 
         Args:
-            output_path: Path for the output tar.gz file.
+            output_path: Path for the output archive; a .tar.zst suffix
+                         selects zstd compression.
                          Defaults to openclaw-backup-<timestamp>.tar.gz.
 
         Returns:
@@ -129,55 +480,62 @@ class MigrationManager:
 
         included: List[str] = []
 
-        with tarfile.open(str(archive_path), "w:gz") as tar:
-            # Back up config files
-            for rel_path in CONFIG_FILES:
-                filepath = self.project_dir / rel_path
-                if filepath.exists() and filepath.is_file():
-                    self._add_file_to_tar(
-                        tar, filepath, f"{archive_prefix}/{rel_path}", manifest
-                    )
-                    included.append(rel_path)
+        # Back up config files, data files and log files
+        rel_paths = self._collect_backup_files()
+        snapshots: List[Tuple[str, Snapshot]] = []
 
-            # Back up data files
-            for rel_path in DATA_FILES:
-                filepath = self.project_dir / rel_path
-                if filepath.exists() and filepath.is_file():
-                    self._add_file_to_tar(
-                        tar, filepath, f"{archive_prefix}/{rel_path}", manifest
-                    )
-                    included.append(rel_path)
+        # Snapshots that don't fit in memory are appended to one shared spill
+        # file, so only a bounded number of files is open however many are
+        # backed up
+        spill = tempfile.TemporaryFile()
 
-            # Back up log files
-            logs_dir = self.project_dir / "logs"
-            if logs_dir.exists() and logs_dir.is_dir():
-                for log_file in sorted(logs_dir.rglob("*")):
-                    if log_file.is_file():
-                        rel = log_file.relative_to(self.project_dir)
-                        self._add_file_to_tar(
-                            tar, log_file, f"{archive_prefix}/{rel}", manifest
-                        )
-                        included.append(str(rel))
+        try:
+            # Snapshot and hash every file first (on worker threads; hashlib
+            # releases the GIL) so the manifest can lead the archive
+            in_memory = 0
+            for rel_path, snapshot in zip(
+                rel_paths,
+                _bounded_map(self._snapshot_file, rel_paths, BACKUP_WORKERS),
+            ):
+                data, checksum, mtime = snapshot
+                manifest["files"][rel_path] = checksum
+
+                # Keep total snapshot memory bounded; snapshots too large to
+                # stay spooled in memory have already rolled over to a file
+                size = data.tell()
+                if size > HASH_CHUNK_SIZE or in_memory + size > SNAPSHOT_MEMORY_BUDGET:
+                    snapshot = (self._spill_snapshot(data, spill), checksum, mtime)
+                else:
+                    in_memory += size
+                snapshots.append((rel_path, snapshot))
 
             # Generate .env.template (never include actual .env)
             template_bytes = ENV_TEMPLATE_CONTENT.encode("utf-8")
-            template_arcname = f"{archive_prefix}/config/.env.template"
-            info = tarfile.TarInfo(name=template_arcname)
-            info.size = len(template_bytes)
-            info.mtime = int(time.time())
-            tar.addfile(info, io.BytesIO(template_bytes))
             manifest["files"]["config/.env.template"] = compute_sha256(template_bytes)
-            included.append("config/.env.template (generated)")
 
-            # Write manifest.json into the archive
-            manifest_bytes = json.dumps(manifest, indent=2).encode("utf-8")
-            manifest_info = tarfile.TarInfo(
-                name=f"{archive_prefix}/manifest.json"
-            )
-            manifest_info.size = len(manifest_bytes)
-            manifest_info.mtime = int(time.time())
-            tar.addfile(manifest_info, io.BytesIO(manifest_bytes))
-            included.append("manifest.json")
+            with open_archive_writer(archive_path) as tar:
+                # Write manifest.json first, so restore can check each member
+                # as it streams past
+                self._add_bytes_to_tar(
+                    tar, f"{archive_prefix}/manifest.json", dump_manifest(manifest)
+                )
+                included.append("manifest.json")
+
+                for rel_path, snapshot in snapshots:
+                    self._add_snapshot_to_tar(
+                        tar, snapshot, f"{archive_prefix}/{rel_path}"
+                    )
+                    included.append(rel_path)
+
+                self._add_bytes_to_tar(
+                    tar, f"{archive_prefix}/config/.env.template", template_bytes
+                )
+                included.append("config/.env.template (generated)")
+        finally:
+            for _, (data, _, _) in snapshots:
+                if not isinstance(data, ArchiveSlice):
+                    data.close()
+            spill.close()
 
         # Print summary
         print("📋 Backed up files:")
@@ -197,10 +555,15 @@ class MigrationManager:
 
         Validates archive integrity using manifest checksums, then extracts
         configuration files, conversation data, usage statistics, and
-        optionally logs.
+        optionally logs. The archive is decompressed once: members are hashed
+        while being written to ``.part`` files next to their targets, which
+        are only moved into place (atomically, per file) once every checksum
+        matches. On a failed check the staged files are removed again; with
+        the manifest at the front of the archive, a bad member stops the
+        restore as soon as it is read.
 
         Args:
-            archive_path: Path to the backup tar.gz archive.
+            archive_path: Path to the backup archive.
             skip_logs: If True, skip restoring log files.
 
         Returns:
@@ -221,59 +584,64 @@ class MigrationManager:
         print(f"   Target: {self.project_dir}")
         print()
 
-        # Read manifest from archive
-        manifest = self._read_manifest(archive)
-
-        print(f"   Backup timestamp: {manifest.get('timestamp', 'unknown')}")
-        print(f"   Backup version: {manifest.get('version', 'unknown')}")
-        print()
+        def keep(rel_path: str) -> bool:
+            return not (skip_logs and rel_path.startswith("logs/"))
 
-        # Validate integrity
-        print("🔍 Validating archive integrity...")
-        violations = self.validate_integrity(archive, manifest)
-        if violations:
-            violation_list = "\n  ".join(violations)
-            raise ValueError(
-                f"Integrity validation failed:\n  {violation_list}"
-            )
-        print("✅ Integrity check passed")
-        print()
-
-        # Extract files
         restored: List[str] = []
         skipped: List[str] = []
         errors: List[str] = []
-
-        with tarfile.open(str(archive), "r:gz") as tar:
-            for member in tar.getmembers():
-                if not member.isfile():
-                    continue
-
-                # Strip the archive prefix to get relative path
-                rel_path = self._strip_prefix(member.name)
-                if rel_path is None:
-                    continue
-
-                # Skip manifest itself
-                if rel_path == "manifest.json":
-                    continue
-
-                # Skip logs if requested
-                if skip_logs and rel_path.startswith("logs/"):
+        staged: List[Path] = []
+        created_dirs: List[Path] = []
+
+        with contextlib.ExitStack() as resources:
+            try:
+                manifest, members = self._scan_archive(
+                    archive, keep, resources, staged, created_dirs, errors,
+                    fail_fast=True,
+                )
+
+                print(f"   Backup timestamp: {manifest.get('timestamp', 'unknown')}")
+                print(f"   Backup version: {manifest.get('version', 'unknown')}")
+                print()
+
+                # Validate integrity
+                print("🔍 Validating archive integrity...")
+                violations = self._check_checksums(manifest, members)
+                if violations:
+                    violation_list = "\n  ".join(violations)
+                    raise ValueError(
+                        f"Integrity validation failed:\n  {violation_list}"
+                    )
+                print("✅ Integrity check passed")
+                print()
+            except BaseException:
+                self._discard_staged(staged, created_dirs)
+                raise
+
+            # Move staged files into place
+            for rel_path, _, data in members:
+                if not keep(rel_path):
                     skipped.append(rel_path)
                     continue
+                if data is None:
+                    continue  # Could not be staged; already in errors
 
-                # Extract to project directory
-                target = self.project_dir / rel_path
+                part = self._part_path(rel_path)
                 try:
-                    target.parent.mkdir(parents=True, exist_ok=True)
-                    f = tar.extractfile(member)
-                    if f is not None:
-                        target.write_bytes(f.read())
-                        restored.append(rel_path)
+                    if isinstance(data, ArchiveSlice):
+                        self._make_parents(part, created_dirs)
+                        with open(part, "wb", buffering=HASH_CHUNK_SIZE) as out:
+                            _preallocate(out.fileno(), data.size)
+                            _copy_range(data.source, data.offset, data.size, out)
+                    os.replace(part, self.project_dir / rel_path)
+                    restored.append(rel_path)
                 except Exception as e:
+                    part.unlink(missing_ok=True)
                     errors.append(f"{rel_path}: {e}")
 
+        # Make the restore durable with one batch of fsyncs at the end
+        errors.extend(self._sync_restored(restored))
+
         # Print summary
         print("📋 Restore results:")
         for name in sorted(restored):
@@ -298,104 +666,419 @@ class MigrationManager:
             "errors": errors,
         }
 
+    def _sync_restored(self, rel_paths: List[str]) -> List[str]:
+        """fsync restored files, then their parent directories.
+
+        Files are synced concurrently on a thread pool so the disk can
+        service the flushes together; directories are synced afterwards so
+        the newly created entries are durable too (POSIX only).
+
+        Args:
+            rel_paths: Restored paths relative to the project root.
+
+        Returns:
+            List of error messages for paths that could not be synced.
+        """
+        paths = [self.project_dir / rel_path for rel_path in rel_paths]
+        errors = [
+            err
+            for err in _bounded_map(_fsync_path, paths, BACKUP_WORKERS)
+            if err is not None
+        ]
+
+        if os.name != "nt":
+            for directory in sorted({path.parent for path in paths}):
+                err = _fsync_path(directory)
+                if err is not None:
+                    errors.append(err)
+
+        return errors
+
     def validate_integrity(
         self, archive_path: Path, manifest: Optional[Dict[str, Any]] = None
     ) -> List[str]:
         """Validate archive integrity against manifest checksums.
 
         Args:
-            archive_path: Path to the backup tar.gz archive.
+            archive_path: Path to the backup archive.
             manifest: Pre-loaded manifest dict. If None, reads from archive.
 
         Returns:
             List of integrity violation messages (empty if all OK).
+
+        Raises:
+            ValueError: If no manifest is given and none is in the archive.
         """
         archive = Path(archive_path).resolve()
 
+        with contextlib.ExitStack() as resources:
+            archived_manifest, members = self._scan_archive(
+                archive, lambda rel_path: False, resources,
+                require_manifest=manifest is None,
+            )
         if manifest is None:
-            manifest = self._read_manifest(archive)
+            manifest = archived_manifest
+        return self._check_checksums(manifest, members)
 
-        file_checksums: Dict[str, str] = manifest.get("files", {})
-        violations: List[str] = []
+    def _scan_archive(
+        self,
+        archive_path: Path,
+        keep: Callable[[str], bool],
+        resources: contextlib.ExitStack,
+        staged: Optional[List[Path]] = None,
+        created_dirs: Optional[List[Path]] = None,
+        errors: Optional[List[str]] = None,
+        fail_fast: bool = False,
+        require_manifest: bool = True,
+    ) -> Tuple[
+        Optional[Dict[str, Any]], List[Tuple[str, Optional[str], Optional[MemberData]]]
+    ]:
+        """Read a backup archive in a single streaming pass.
+
+        Every regular member is hashed as it is decompressed. Members selected
+        by ``keep`` are also written to a ``.part`` file next to their target
+        (recorded in ``staged``, with any directories made for them in
+        ``created_dirs``), so they can be moved into place after validation
+        without reading the archive again. For uncompressed archives, their
+        location in the archive is recorded instead, so they can be copied
+        straight from it.
+
+        Args:
+            archive_path: Path to the backup archive.
+            keep: Predicate on the relative path deciding whether to retain
+                  a member's contents.
+            resources: ExitStack that owns files opened for later copies.
+            staged: List to record ``.part`` files written.
+            created_dirs: List to record directories created.
+            errors: List to record members that could not be staged.
+            fail_fast: If True, raise on the first member that fails its
+                       manifest check, when the manifest precedes it.
+            require_manifest: If True, raise when the archive has no
+                              manifest.json; otherwise return None for it.
+
+        Returns:
+            Tuple of (manifest, members), where each member is
+            (rel_path, checksum or None if unreadable, retained data or None).
+
+        Raises:
+            ValueError: If no manifest.json found in the archive (with
+                        require_manifest), or (with fail_fast) a member
+                        fails its manifest check.
+        """
+        staged = [] if staged is None else staged
+        created_dirs = [] if created_dirs is None else created_dirs
+        errors = [] if errors is None else errors
 
-        with tarfile.open(str(archive), "r:gz") as tar:
-            for member in tar.getmembers():
+        manifest: Optional[Dict[str, Any]] = None
+        members: List[Tuple[str, Optional[str], Optional[MemberData]]] = []
+
+        source: Optional[BinaryIO] = None
+        if is_uncompressed_tar(archive_path):
+            source = resources.enter_context(open(archive_path, "rb"))
+
+        with open_archive_reader(archive_path) as tar:
+            for member in tar:
                 if not member.isfile():
                     continue
 
                 rel_path = self._strip_prefix(member.name)
-                if rel_path is None or rel_path == "manifest.json":
+                if rel_path is None:
                     continue
 
-                if rel_path not in file_checksums:
-                    violations.append(
-                        f"{rel_path}: not listed in manifest"
-                    )
+                f = tar.extractfile(member)
+                if rel_path == "manifest.json":
+                    if f is not None:
+                        manifest = load_manifest(f.read())
                     continue
 
-                f = tar.extractfile(member)
                 if f is None:
-                    violations.append(f"{rel_path}: could not read from archive")
-                    continue
+                    checksum, data = None, None
+                elif not keep(rel_path):
+                    checksum, data = compute_stream_sha256(f), None
+                elif source is not None:
+                    checksum = compute_stream_sha256(f)
+                    data = ArchiveSlice(source, member.offset_data, member.size)
+                else:
+                    checksum, data = self._stage_member(
+                        f, rel_path, member.size, staged, created_dirs, errors
+                    )
+                members.append((rel_path, checksum, data))
 
-                actual = compute_sha256(f.read())
-                expected = file_checksums[rel_path]
-                if actual != expected:
-                    violations.append(
-                        f"{rel_path}: checksum mismatch "
-                        f"(expected {expected[:12]}..., got {actual[:12]}...)"
+                # Backups list the manifest first, so members can be checked
+                # as they stream past instead of after the whole archive
+                if fail_fast and manifest is not None:
+                    violation = self._check_member(
+                        manifest.get("files", {}), rel_path, checksum
                     )
+                    if violation is not None:
+                        raise ValueError(
+                            f"Integrity validation failed:\n  {violation}"
+                        )
 
-        return violations
+        if manifest is None and require_manifest:
+            raise ValueError("No manifest.json found in backup archive")
 
-    def _add_file_to_tar(
+        return manifest, members
+
+    def _stage_member(
         self,
-        tar: tarfile.TarFile,
-        filepath: Path,
-        arcname: str,
-        manifest: Dict[str, Any],
+        f: BinaryIO,
+        rel_path: str,
+        size: int,
+        staged: List[Path],
+        created_dirs: List[Path],
+        errors: List[str],
+    ) -> Tuple[str, Optional[Path]]:
+        """Hash an archive member while writing it to its ``.part`` file.
+
+        Args:
+            f: Member file object from the archive.
+            rel_path: Path of the member relative to the project root.
+            size: Member size from its tar header.
+            staged: List to record the ``.part`` file in.
+            created_dirs: List to record directories created for it.
+            errors: List to record a failure to stage the member.
+
+        Returns:
+            Tuple of (SHA-256 hex digest, ``.part`` path or None if it could
+            not be written).
+        """
+        h = hashlib.sha256()
+        part: Optional[Path] = self._part_path(rel_path)
+        try:
+            self._make_parents(part, created_dirs)
+            staged.append(part)
+            with open(part, "wb", buffering=HASH_CHUNK_SIZE) as out:
+                _preallocate(out.fileno(), size)
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    h.update(chunk)
+                    out.write(chunk)
+        except OSError as e:
+            errors.append(f"{rel_path}: {e}")
+            part.unlink(missing_ok=True)
+            part = None
+            # Finish hashing the member so it is still validated
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                h.update(chunk)
+        return h.hexdigest(), part
+
+    def _part_path(self, rel_path: str) -> Path:
+        """Return the staging path used while restoring a file.
+
+        Args:
+            rel_path: Path of the file relative to the project root.
+
+        Returns:
+            Sibling path of the target with a ``.part`` suffix appended.
+        """
+        target = self.project_dir / rel_path
+        return target.with_name(target.name + ".part")
+
+    def _make_parents(self, path: Path, created_dirs: List[Path]) -> None:
+        """Create missing parent directories of a path, recording them.
+
+        Args:
+            path: Path whose parent directories should exist.
+            created_dirs: List to append newly created directories to,
+                          outermost first.
+        """
+        missing: List[Path] = []
+        parent = path.parent
+        while not parent.exists():
+            missing.append(parent)
+            parent = parent.parent
+        for directory in reversed(missing):
+            directory.mkdir(exist_ok=True)
+            created_dirs.append(directory)
+
+    def _discard_staged(
+        self, staged: List[Path], created_dirs: List[Path]
     ) -> None:
-        """Add a file to the tar archive and record its checksum in the manifest.
+        """Roll back a restore that failed before any file was moved in.
 
         Args:
-            tar: Open TarFile to add to.
-            filepath: Absolute path to the file on disk.
-            arcname: Name to use inside the archive.
-            manifest: Manifest dict to update with checksum.
+            staged: ``.part`` files written so far.
+            created_dirs: Directories created for them, outermost first.
         """
-        data = filepath.read_bytes()
-        checksum = compute_sha256(data)
+        for part in staged:
+            part.unlink(missing_ok=True)
+        for directory in reversed(created_dirs):
+            try:
+                directory.rmdir()
+            except OSError:
+                pass
+
+    def _check_checksums(
+        self,
+        manifest: Dict[str, Any],
+        members: List[Tuple[str, Optional[str], Optional[MemberData]]],
+    ) -> List[str]:
+        """Compare scanned member checksums against the manifest.
 
-        info = tarfile.TarInfo(name=arcname)
-        info.size = len(data)
-        info.mtime = int(filepath.stat().st_mtime)
-        tar.addfile(info, io.BytesIO(data))
+        Args:
+            manifest: Parsed manifest dict.
+            members: Members as returned by _scan_archive.
+
+        Returns:
+            List of integrity violation messages (empty if all OK).
+        """
+        file_checksums: Dict[str, str] = manifest.get("files", {})
+        violations: List[str] = []
+
+        for rel_path, actual, _ in members:
+            violation = self._check_member(file_checksums, rel_path, actual)
+            if violation is not None:
+                violations.append(violation)
 
-        # Store relative path (strip archive prefix) as key
-        rel_path = self._strip_prefix(arcname)
-        if rel_path:
-            manifest["files"][rel_path] = checksum
+        return violations
 
-    def _read_manifest(self, archive_path: Path) -> Dict[str, Any]:
-        """Read manifest.json from a backup archive.
+    def _check_member(
+        self,
+        file_checksums: Dict[str, str],
+        rel_path: str,
+        actual: Optional[str],
+    ) -> Optional[str]:
+        """Compare one member's checksum against the manifest.
 
         Args:
-            archive_path: Path to the tar.gz archive.
+            file_checksums: Manifest mapping of relative path to checksum.
+            rel_path: Path of the member relative to the project root.
+            actual: Checksum of the member, or None if it was unreadable.
 
         Returns:
-            Parsed manifest dict.
+            Violation message, or None if the member is OK.
+        """
+        if rel_path not in file_checksums:
+            return f"{rel_path}: not listed in manifest"
 
-        Raises:
-            ValueError: If no manifest.json found in the archive.
+        if actual is None:
+            return f"{rel_path}: could not read from archive"
+
+        expected = file_checksums[rel_path]
+        if actual != expected:
+            return (
+                f"{rel_path}: checksum mismatch "
+                f"(expected {expected[:12]}..., got {actual[:12]}...)"
+            )
+
+        return None
+
+    def _collect_backup_files(self) -> List[str]:
+        """List the files to back up, relative to the project root.
+
+        Returns:
+            Relative paths of existing config, data and log files, in
+            archive order.
         """
-        with tarfile.open(str(archive_path), "r:gz") as tar:
-            for member in tar.getmembers():
-                if member.name.endswith("manifest.json") and member.isfile():
-                    f = tar.extractfile(member)
-                    if f is not None:
-                        return json.loads(f.read().decode("utf-8"))
+        rel_paths: List[str] = []
+
+        for rel_path in CONFIG_FILES + DATA_FILES:
+            # One stat() instead of exists() followed by is_file()
+            try:
+                st = os.stat(self.project_dir / rel_path)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
+                rel_paths.append(rel_path)
+
+        logs_dir = self.project_dir / "logs"
+        if logs_dir.is_dir():
+            root = str(self.project_dir)
+            rel_paths.extend(
+                os.path.relpath(path, root) for path in _walk_files(str(logs_dir))
+            )
+
+        return rel_paths
+
+    def _snapshot_file(self, rel_path: str) -> Tuple[BinaryIO, str, int]:
+        """Copy a file into a spooled snapshot while hashing it.
+
+        Streaming the file once through the hash and into the snapshot keeps
+        the tar header size matching exactly what was hashed (logs may be
+        appended to while the backup runs) without holding it all in memory.
+
+        Args:
+            rel_path: Path of the file relative to the project root.
+
+        Returns:
+            Tuple of (snapshot positioned at its end, SHA-256 hex digest,
+            mtime). The caller owns and must close the snapshot.
+        """
+        h = hashlib.sha256()
+        snapshot = tempfile.SpooledTemporaryFile(max_size=HASH_CHUNK_SIZE)
+        try:
+            with open(self.project_dir / rel_path, "rb") as src:
+                mtime = int(os.fstat(src.fileno()).st_mtime)
+                for chunk in iter(lambda: src.read(HASH_CHUNK_SIZE), b""):
+                    h.update(chunk)
+                    snapshot.write(chunk)
+        except BaseException:
+            snapshot.close()
+            raise
+        return snapshot, h.hexdigest(), mtime
+
+    def _spill_snapshot(self, data: BinaryIO, spill: BinaryIO) -> ArchiveSlice:
+        """Move a snapshot to the end of the shared spill file.
 
-        raise ValueError("No manifest.json found in backup archive")
+        Args:
+            data: Snapshot positioned at its end; closed once copied.
+            spill: Shared spill file.
+
+        Returns:
+            Location of the snapshot's bytes in the spill file.
+        """
+        with data:
+            size = data.tell()
+            data.seek(0)
+            offset = spill.seek(0, os.SEEK_END)
+            shutil.copyfileobj(data, spill, HASH_CHUNK_SIZE)
+        return ArchiveSlice(spill, offset, size)
+
+    def _add_snapshot_to_tar(
+        self,
+        tar: tarfile.TarFile,
+        snapshot: Snapshot,
+        arcname: str,
+    ) -> None:
+        """Add a file snapshot to the tar archive.
+
+        Args:
+            tar: Open TarFile to add to.
+            snapshot: (data, checksum, mtime) as returned by _snapshot_file,
+                      or with data moved to the spill file; an in-memory
+                      snapshot is closed once written.
+            arcname: Name to use inside the archive.
+        """
+        data, _, mtime = snapshot
+        info = tarfile.TarInfo(name=arcname)
+        info.mtime = mtime
+
+        if isinstance(data, ArchiveSlice):
+            # addfile() reads exactly info.size bytes from the current offset
+            info.size = data.size
+            data.source.seek(data.offset)
+            tar.addfile(info, data.source)
+            return
+
+        with data:
+            info.size = data.tell()
+            data.seek(0)
+            tar.addfile(info, data)
+
+    def _add_bytes_to_tar(
+        self, tar: tarfile.TarFile, arcname: str, data: bytes
+    ) -> None:
+        """Add an in-memory file to the tar archive.
+
+        Args:
+            tar: Open TarFile to add to.
+            arcname: Name to use inside the archive.
+            data: File contents.
+        """
+        info = tarfile.TarInfo(name=arcname)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        tar.addfile(info, io.BytesIO(data))
 
     def _strip_prefix(self, arcname: str) -> Optional[str]:
         """Strip the archive prefix from a member name.
@@ -418,21 +1101,49 @@ class MigrationManager:
             Version string, or 'unknown' if not found.
         """
         pyproject = self.project_dir / "pyproject.toml"
-        if not pyproject.exists():
+        try:
+            mtime_ns = pyproject.stat().st_mtime_ns
+        except OSError:
             return "unknown"
 
-        try:
-            content = pyproject.read_text()
-            for line in content.splitlines():
+        return _read_version(str(pyproject), mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_version(pyproject: str, mtime_ns: int) -> str:
+    """Parse ``[project].version`` from a pyproject.toml file.
+
+    Cached per path and modification time, so repeated backups do not
+    re-parse an unchanged file. Uses tomllib where available and falls back
+    to scanning the ``[project]`` table line by line on older Pythons.
+
+    Args:
+        pyproject: Path to pyproject.toml.
+        mtime_ns: Modification time of the file (part of the cache key).
+
+    Returns:
+        Version string, or 'unknown' if not found.
+    """
+    try:
+        if tomllib is not None:
+            with open(pyproject, "rb") as fp:
+                version = tomllib.load(fp).get("project", {}).get("version")
+            return version if isinstance(version, str) else "unknown"
+
+        with open(pyproject, encoding="utf-8") as fp:
+            in_project = False
+            for line in fp:
                 line = line.strip()
-                if line.startswith("version"):
+                if line.startswith("["):
+                    in_project = line == "[project]"
+                elif in_project and line.partition("=")[0].strip() == "version":
                     # Parse version = "x.y.z"
                     _, _, value = line.partition("=")
                     return value.strip().strip('"').strip("'")
-        except Exception:
-            pass
+    except Exception:
+        pass
 
-        return "unknown"
+    return "unknown"
 
 
 def main() -> int:
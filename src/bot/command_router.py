@@ -6,7 +6,7 @@ from typing import Awaitable, Callable, Optional
 
 from ..llm.provider_manager import ProviderManager
 from ..llm.rate_limiter import RateLimiter
-from ..security.auth import AuthManager
+from ..security.auth import AuthManager, DecisionCache
 from ..utils.context_store import ContextStore
 
 logger = logging.getLogger(__name__)
@@ -14,11 +14,23 @@ logger = logging.getLogger(__name__)
 # Bot version
 VERSION = "0.3.1"
 
+# Static command responses, built once at import
+START_MESSAGE = (
+    "👋 Welcome to OpenClaw AI Bot!\n\n"
+    "I'm an AI assistant powered by multiple LLM providers. "
+    "Just send me a message and I'll respond.\n\n"
+    "Use /help to see available commands."
+)
+VERSION_MESSAGE = f"🤖 OpenClaw Bot v{VERSION}"
 
-@dataclass
+
+@dataclass(frozen=True)
 class CommandHandler:
     """Registered command handler."""
 
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = ("name", "handler", "permission_level", "description")
+
     name: str
     handler: Callable[..., Awaitable[str]]
     permission_level: str
@@ -48,6 +60,10 @@ class CommandRouter:
         self.rate_limiter = rate_limiter
         self.context_store = context_store
         self.handlers: dict[str, CommandHandler] = {}
+        self._levels: set[str] = set()
+        self._perm_cache = DecisionCache()
+        self._reload_callbacks: list[Callable[[], None]] = []
+        self._help_cache: dict[frozenset[str], str] = {}
 
         # Register built-in commands
         self._register_core_commands()
@@ -75,6 +91,40 @@ class CommandRouter:
             permission_level=permission_level,
             description=description,
         )
+        self._levels.add(permission_level)
+        self._help_cache.clear()
+
+    def _check_permission(self, user_id: int, level: str) -> bool:
+        """Check a permission level, reusing recent results.
+
+        Args:
+            user_id: Telegram user ID
+            level: Required permission level
+
+        Returns:
+            True if user has sufficient permissions
+        """
+        key = (user_id, level)
+        self._perm_cache.check_version(self.auth_manager.version)
+        cached = self._perm_cache.get(key)
+        if cached is not None:
+            return cached
+
+        allowed = self.auth_manager.check_permission(user_id, level)
+        self._perm_cache.put(key, allowed)
+        return allowed
+
+    def clear_permission_cache(self) -> None:
+        """Forget cached permission checks (e.g. after permissions change)."""
+        self._perm_cache.clear()
+
+    def on_reload(self, callback: Callable[[], None]) -> None:
+        """Register a callback for /reload, e.g. to drop other cached auth decisions.
+
+        Args:
+            callback: Function called with no arguments
+        """
+        self._reload_callbacks.append(callback)
 
     async def route(
         self,
@@ -93,13 +143,12 @@ class CommandRouter:
             Response string
         """
         # Check if command exists
-        if command not in self.handlers:
+        handler = self.handlers.get(command)
+        if handler is None:
             return f"Unknown command: /{command}. Use /help to see available commands."
 
-        handler = self.handlers[command]
-
         # Check permission
-        if not self.auth_manager.check_permission(user_id, handler.permission_level):
+        if not self._check_permission(user_id, handler.permission_level):
             logger.warning(f"User {user_id} denied access to /{command}")
             return "You don't have permission to use this command."
 
@@ -119,13 +168,27 @@ class CommandRouter:
         Returns:
             List of available CommandHandlers
         """
-        available = []
+        allowed = self._allowed_levels(user_id)
 
-        for handler in self.handlers.values():
-            if self.auth_manager.check_permission(user_id, handler.permission_level):
-                available.append(handler)
+        return [
+            handler for handler in self.handlers.values()
+            if handler.permission_level in allowed
+        ]
 
-        return available
+    def _allowed_levels(self, user_id: int) -> frozenset[str]:
+        """Get the registered permission levels a user satisfies.
+
+        Args:
+            user_id: Telegram user ID
+
+        Returns:
+            Set of permission levels the user can access
+        """
+        # One check per distinct permission level, not per command
+        return frozenset(
+            level for level in self._levels
+            if self._check_permission(user_id, level)
+        )
 
     def _register_core_commands(self) -> None:
         """Register core bot commands."""
@@ -156,22 +219,21 @@ class CommandRouter:
 
     async def cmd_start(self, user_id: int, args: list[str]) -> str:
         """Handle /start command."""
-        return (
-            "👋 Welcome to OpenClaw AI Bot!\n\n"
-            "I'm an AI assistant powered by multiple LLM providers. "
-            "Just send me a message and I'll respond.\n\n"
-            "Use /help to see available commands."
-        )
+        return START_MESSAGE
 
     async def cmd_help(self, user_id: int, args: list[str]) -> str:
         """Handle /help command."""
-        available = self.get_available_commands(user_id)
-
-        lines = ["📚 Available Commands:\n"]
-        for handler in sorted(available, key=lambda h: h.name):
-            lines.append(f"/{handler.name} - {handler.description}")
-
-        return "\n".join(lines)
+        # Help text only depends on which permission levels the user has
+        allowed = self._allowed_levels(user_id)
+        text = self._help_cache.get(allowed)
+        if text is None:
+            lines = ["📚 Available Commands:\n"]
+            for handler in sorted(self.handlers.values(), key=lambda h: h.name):
+                if handler.permission_level in allowed:
+                    lines.append(f"/{handler.name} - {handler.description}")
+            text = self._help_cache[allowed] = "\n".join(lines)
+
+        return text
 
     async def cmd_status(self, user_id: int, args: list[str]) -> str:
         """Handle /status command."""
@@ -211,7 +273,7 @@ class CommandRouter:
 
     async def cmd_version(self, user_id: int, args: list[str]) -> str:
         """Handle /version command."""
-        return f"🤖 OpenClaw Bot v{VERSION}"
+        return VERSION_MESSAGE
 
     # Provider command handlers
 
@@ -328,4 +390,7 @@ class CommandRouter:
     async def cmd_reload(self, user_id: int, args: list[str]) -> str:
         """Handle /reload command (admin)."""
         # Would trigger config reload
+        self.clear_permission_cache()
+        for callback in self._reload_callbacks:
+            callback()
         return "🔄 Configuration reload requested."
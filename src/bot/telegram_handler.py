@@ -1,23 +1,27 @@
 """Telegram bot handler for OpenClaw."""
 
 import asyncio
+import contextlib
+import importlib.util
 import logging
+import weakref
+from datetime import timedelta
+from pathlib import Path
 from typing import Optional
+from urllib.parse import urlsplit
 
-from telegram import Update
+from telegram import InputFile, Update
+from telegram.error import RetryAfter, TelegramError
 from telegram.ext import (
     Application,
     ContextTypes,
     MessageHandler,
     filters,
 )
-from telegram.ext import (
-    CommandHandler as TGCommandHandler,
-)
 
 from ..llm.provider_manager import ProviderManager
 from ..llm.rate_limiter import RateLimiter
-from ..security.auth import AuthManager
+from ..security.auth import AuthManager, DecisionCache
 from ..utils.audit_logger import AuditLogger
 from ..utils.context_store import ContextStore
 from ..web.dashboard import dashboard_state
@@ -25,6 +29,128 @@ from .command_router import CommandRouter
 
 logger = logging.getLogger(__name__)
 
+# Seconds between applying queued updates to the shared dashboard state
+DASHBOARD_FLUSH_INTERVAL = 1.0
+
+# Dashboard updates queued before they are applied early, bounding the queue
+# under a burst of messages
+DASHBOARD_QUEUE_SIZE = 1024
+
+# Seconds between saving changed conversation contexts to disk; an SD card is
+# spared a write per message, and a crash loses at most this much history
+CONTEXT_SAVE_INTERVAL = 30.0
+
+# Updates PTB processes at once; long LLM replies no longer hold up commands
+CONCURRENT_UPDATES = 32
+
+# LLM replies streamed at once; further messages wait for a free slot
+MAX_CONCURRENT_REPLIES = 8
+
+# Seconds Telegram holds a getUpdates long poll open while the bot is idle
+POLL_TIMEOUT = 30
+
+# Bot API calls (streaming edits included) share one multiplexed connection
+# over HTTP/2 when h2 is installed: pip install "python-telegram-bot[http2]"
+HTTP_VERSION = "2" if importlib.util.find_spec("h2") else "1.1"
+
+# Only plain messages are handled; Telegram doesn't send us anything else
+ALLOWED_UPDATES = [Update.MESSAGE]
+
+# Update filters for the two handlers, composed once at import
+COMMAND_MESSAGES = filters.COMMAND
+TEXT_MESSAGES = filters.TEXT & ~filters.COMMAND
+
+# Characters of a response shown in one message (Telegram's hard limit is 4096)
+MESSAGE_TEXT_LIMIT = 4000
+
+# Characters of a partial response shown when streaming fails, leaving room
+# for the error note appended to it
+INTERRUPTED_TEXT_LIMIT = 3900
+
+# How far back from the limit to look for a space to cut a long response at
+TRUNCATE_WORD_WINDOW = 200
+
+# Skill output files sent as playable video or audio rather than as documents
+VIDEO_EXTENSIONS = frozenset({".mp4", ".webm", ".mkv", ".avi", ".mov"})
+AUDIO_EXTENSIONS = frozenset({".mp3", ".ogg", ".m4a", ".wav", ".flac", ".opus"})
+
+# Seconds allowed for reading and writing a skill file upload
+UPLOAD_TIMEOUT = 120
+
+# Longest flood-control wait honoured before retrying the final edit of a reply
+MAX_FLOOD_WAIT = 10.0
+
+# System prompt placed ahead of the conversation history; providers only read it
+SYSTEM_MESSAGE = {"role": "system", "content": "You are a helpful AI assistant."}
+
+# Most recent messages kept word for word when older ones are folded into the
+# conversation summary
+SUMMARY_KEEP_MESSAGES = 4
+
+# Instruction for folding older messages into the running conversation summary
+SUMMARY_PROMPT = (
+    "Summarize the conversation below in a few sentences, keeping names, facts "
+    "and decisions the assistant may need later. Reply with the summary only."
+)
+
+
+def _display_cut(text: str, limit: int = MESSAGE_TEXT_LIMIT) -> int:
+    """Find where to cut a response so it fits in one message.
+
+    Args:
+        text: Response text
+        limit: Most characters of the response that may be shown
+
+    Returns:
+        len(text) if it fits, otherwise the index of the last space near the
+        limit (or the limit itself when there is none)
+    """
+    if len(text) <= limit:
+        return len(text)
+    cut = text.rfind(" ", limit - TRUNCATE_WORD_WINDOW, limit)
+    return cut if cut != -1 else limit
+
+
+def _retry_seconds(error: RetryAfter) -> float:
+    """Seconds Telegram asked us to wait (retry_after is int or timedelta)."""
+    delay = error.retry_after
+    return delay.total_seconds() if isinstance(delay, timedelta) else float(delay)
+
+
+async def _sleep_unless(event: asyncio.Event, delay: float) -> bool:
+    """Sleep for delay seconds, waking early if event is set.
+
+    Returns:
+        True if the event was set
+    """
+    try:
+        await asyncio.wait_for(event.wait(), delay)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+async def _edit_final(message, text: str) -> None:
+    """Edit a reply for the last time, ignoring Telegram errors.
+
+    If flood control kicks in, waits it out (up to MAX_FLOOD_WAIT) and tries
+    once more so the complete text is not lost.
+
+    Args:
+        message: Telegram message to edit
+        text: New message text
+    """
+    try:
+        await message.edit_text(text)
+    except RetryAfter as e:
+        delay = _retry_seconds(e)
+        if delay <= MAX_FLOOD_WAIT:
+            await asyncio.sleep(delay)
+            with contextlib.suppress(TelegramError):
+                await message.edit_text(text)
+    except TelegramError:
+        pass  # e.g. "message is not modified"
+
 
 class TelegramHandler:
     """Manages all Telegram API interactions."""
@@ -41,6 +167,11 @@ class TelegramHandler:
         streaming_interval_ms: int = 500,
         streaming_min_chars: int = 50,
         skill_registry=None,
+        webhook_url: Optional[str] = None,
+        webhook_listen: str = "0.0.0.0",
+        webhook_port: int = 8443,
+        webhook_secret: Optional[str] = None,
+        api_base_url: Optional[str] = None,
     ):
         """Initialize TelegramHandler.
 
@@ -54,6 +185,12 @@ class TelegramHandler:
             rate_limiter: Optional RateLimiter for tracking API usage
             streaming_interval_ms: Interval for streaming updates
             streaming_min_chars: Minimum chars before streaming update
+            skill_registry: Optional SkillRegistry for skill commands
+            webhook_url: Public URL for receiving updates by webhook; polls if None
+            webhook_listen: Address the webhook server binds to
+            webhook_port: Port the webhook server listens on
+            webhook_secret: Secret token Telegram sends with webhook requests
+            api_base_url: Bot API base URL, e.g. a local telegram-bot-api server
         """
         self.token = token
         self.command_router = command_router
@@ -66,9 +203,103 @@ class TelegramHandler:
         self.streaming_min_chars = streaming_min_chars
 
         self.skill_registry = skill_registry
+        self.webhook_url = webhook_url
+        self.webhook_listen = webhook_listen
+        self.webhook_port = webhook_port
+        self.webhook_secret = webhook_secret
+        self.api_base_url = api_base_url
         self.app: Optional[Application] = None
         self._running = False
 
+        # Dashboard updates are queued and applied in batches while running
+        self._dash_queue: Optional[asyncio.Queue] = None
+        self._dash_task: Optional[asyncio.Task] = None
+
+        # Saves changed contexts periodically while running
+        self._save_task: Optional[asyncio.Task] = None
+
+        # Allowlist decisions, dropped when /reload re-reads permissions
+        self._auth_cache = DecisionCache()
+        command_router.on_reload(self.clear_auth_cache)
+
+        # Bounds LLM streams while updates are handled concurrently
+        self._inflight = asyncio.Semaphore(MAX_CONCURRENT_REPLIES)
+
+        # Per-user locks keeping conversation turns in order; a lock is
+        # dropped once no handler holds or waits for it
+        self._user_locks: weakref.WeakValueDictionary[int, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+        # Typing indicators still being sent; referenced so they aren't
+        # garbage collected mid-request
+        self._typing_tasks: set[asyncio.Task] = set()
+
+    def _is_authorized(self, user_id: int) -> bool:
+        """Check the allowlist, reusing recent decisions until permissions change.
+
+        Args:
+            user_id: Telegram user ID
+
+        Returns:
+            True if user is authorized
+        """
+        self._auth_cache.check_version(self.auth_manager.version)
+        cached = self._auth_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        allowed = self.auth_manager.is_authorized(user_id)
+        self._auth_cache.put(user_id, allowed)
+        return allowed
+
+    def _user_lock(self, user_id: int) -> asyncio.Lock:
+        """Get the lock that serializes a user's conversation turns.
+
+        Args:
+            user_id: Telegram user ID
+
+        Returns:
+            The user's lock, created if no handler is using it
+        """
+        lock = self._user_locks.get(user_id)
+        if lock is None:
+            lock = self._user_locks[user_id] = asyncio.Lock()
+        return lock
+
+    def _start_typing(self, chat) -> None:
+        """Show the typing indicator without waiting for Telegram to confirm it.
+
+        Args:
+            chat: Telegram chat to send the indicator to
+        """
+        task = asyncio.create_task(chat.send_action("typing"))
+        self._typing_tasks.add(task)
+        task.add_done_callback(self._typing_sent)
+
+    def _typing_sent(self, task: asyncio.Task) -> None:
+        """Forget a finished typing indicator, logging why it failed if it did.
+
+        Args:
+            task: Task started by _start_typing
+        """
+        self._typing_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Failed to send typing indicator: {task.exception()}")
+
+    def _record_failed_attempt(self, user_id: int) -> None:
+        """Record a failed auth attempt and drop the cached decision.
+
+        Args:
+            user_id: Telegram user ID
+        """
+        self._auth_cache.discard(user_id)
+        self.auth_manager.record_failed_attempt(user_id)
+
+    def clear_auth_cache(self) -> None:
+        """Forget cached allowlist decisions (e.g. after permissions change)."""
+        self._auth_cache.clear()
+
     def _update_rate_limit_stats(self) -> None:
         """Update dashboard with current rate limit usage."""
         if not self.rate_limiter:
@@ -90,23 +321,137 @@ class TelegramHandler:
                 },
             }
 
+    def _publish(self, *event) -> None:
+        """Queue a dashboard update, or apply it now if not running.
+
+        Events are tuples tagged by their first element:
+            ("message", user_id, activity_type, text, icon)
+            ("activity", activity_type, text, icon)
+            ("record", username, user_message, bot_response)
+            ("response", username, user_message, bot_response, tokens)
+        """
+        if self._dash_queue is None:
+            self._apply_dashboard_events([event])
+            return
+
+        if self._dash_queue.full():
+            self._flush_dashboard()
+        self._dash_queue.put_nowait(event)
+
+    def _flush_dashboard(self) -> None:
+        """Apply all queued dashboard updates."""
+        if self._dash_queue is None:
+            return
+
+        events = []
+        while not self._dash_queue.empty():
+            events.append(self._dash_queue.get_nowait())
+        if events:
+            self._apply_dashboard_events(events)
+
+    async def _drain_dashboard(self) -> None:
+        """Apply queued dashboard updates at a fixed rate until cancelled."""
+        while True:
+            await asyncio.sleep(DASHBOARD_FLUSH_INTERVAL)
+            self._flush_dashboard()
+
+    async def _save_contexts(self) -> None:
+        """Save changed conversation contexts at a fixed rate until cancelled."""
+        while True:
+            await asyncio.sleep(CONTEXT_SAVE_INTERVAL)
+            if not self.context_store.dirty:
+                continue
+            # Copied here, on the loop, so messages handled during the write
+            # don't change the data being written
+            data = self.context_store.snapshot()
+            try:
+                await asyncio.to_thread(self.context_store.write_snapshot, data)
+            except OSError as e:
+                self.context_store.dirty = True
+                logger.error(f"Failed to save contexts: {e}")
+
+    def _apply_dashboard_events(self, events: list[tuple]) -> None:
+        """Apply a batch of dashboard updates to the shared state.
+
+        Args:
+            events: Events as passed to _publish, in order
+        """
+        message_count = 0
+        users: set[int] = set()
+        tokens = 0
+        refresh_limits = False
+
+        for kind, *data in events:
+            if kind == "message":
+                user_id, activity_type, text, icon = data
+                message_count += 1
+                users.add(user_id)
+                dashboard_state.add_activity(activity_type, text, icon)
+            elif kind == "activity":
+                dashboard_state.add_activity(*data)
+            elif kind == "record":
+                dashboard_state.add_message_record(*data)
+            elif kind == "response":
+                username, user_message, bot_response, response_tokens = data
+                tokens += response_tokens
+                refresh_limits = True
+                dashboard_state.add_message_record(username, user_message, bot_response)
+
+        dashboard_state.total_messages += message_count
+        dashboard_state.active_users.update(users)
+        dashboard_state.total_tokens += tokens
+        if refresh_limits:
+            self._update_rate_limit_stats()
+
     async def start(self) -> None:
         """Initialize and start the Telegram bot."""
         logger.info("Starting Telegram bot...")
 
-        self.app = Application.builder().token(self.token).build()
+        self._dash_queue = asyncio.Queue(DASHBOARD_QUEUE_SIZE)
+        self._dash_task = asyncio.create_task(self._drain_dashboard())
+        self._save_task = asyncio.create_task(self._save_contexts())
 
-        # Register command handlers
-        for cmd_name in self.command_router.handlers:
-            self.app.add_handler(TGCommandHandler(cmd_name, self._handle_command))
+        builder = (
+            Application.builder()
+            .token(self.token)
+            .concurrent_updates(CONCURRENT_UPDATES)
+            .http_version(HTTP_VERSION)
+        )
+        if self.api_base_url:
+            # Self-hosted Bot API server; files are served under /file/bot
+            base_url = self.api_base_url.rstrip("/")
+            builder = builder.base_url(base_url)
+            if base_url.endswith("/bot"):
+                builder = builder.base_file_url(base_url[: -len("bot")] + "file/bot")
+        self.app = builder.build()
+
+        # Register a single handler for all commands; _handle_command looks
+        # the command up in the router (unknown commands get a reply there)
+        self.app.add_handler(MessageHandler(COMMAND_MESSAGES, self._handle_command))
 
         # Register message handler for non-command messages
-        self.app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self._handle_message))
+        self.app.add_handler(MessageHandler(TEXT_MESSAGES, self._handle_message))
 
-        # Initialize and start polling
+        # Initialize and start receiving updates
         await self.app.initialize()
         await self.app.start()
-        await self.app.updater.start_polling()
+        if self.webhook_url:
+            # Serve on the public URL's path so a reverse proxy can pass
+            # requests through unchanged; others get a 404
+            await self.app.updater.start_webhook(
+                listen=self.webhook_listen,
+                port=self.webhook_port,
+                url_path=urlsplit(self.webhook_url).path.strip("/"),
+                webhook_url=self.webhook_url,
+                secret_token=self.webhook_secret,
+                allowed_updates=ALLOWED_UPDATES,
+            )
+            logger.info(f"Receiving updates by webhook on port {self.webhook_port}")
+        else:
+            await self.app.updater.start_polling(
+                timeout=POLL_TIMEOUT,
+                allowed_updates=ALLOWED_UPDATES,
+            )
 
         self._running = True
         logger.info("Telegram bot started successfully")
@@ -122,9 +467,22 @@ class TelegramHandler:
             await self.app.stop()
             await self.app.shutdown()
 
-        # Save context on shutdown
+        # Apply any dashboard updates still queued
+        if self._dash_task:
+            self._dash_task.cancel()
+            await asyncio.gather(self._dash_task, return_exceptions=True)
+            self._dash_task = None
+        self._flush_dashboard()
+        self._dash_queue = None
+
+        # Save context on shutdown, off the event loop thread; updates have
+        # stopped by now, so nothing mutates the store while it is written
+        if self._save_task:
+            self._save_task.cancel()
+            await asyncio.gather(self._save_task, return_exceptions=True)
+            self._save_task = None
         if self.context_store:
-            self.context_store.save_to_disk()
+            await asyncio.to_thread(self.context_store.save_to_disk)
 
         logger.info("Telegram bot stopped")
 
@@ -139,29 +497,35 @@ class TelegramHandler:
             update: Telegram update object
             context: Telegram context
         """
-        if not update.message or not update.message.text:
+        msg = update.message
+        if not msg or not msg.text:
             return
 
-        user_id = update.effective_user.id
-        text = update.message.text
-        username = update.effective_user.username or str(user_id)
+        user = update.effective_user
+        user_id = user.id
+        text = msg.text
+        username = user.username or str(user_id)
 
-        # Parse command and args
-        parts = text.split()
-        command = parts[0][1:]  # Remove leading /
-        args = parts[1:] if len(parts) > 1 else []
+        # Parse command and args; only the first word is split off up front
+        head, *rest = text.split(maxsplit=1)
+        command, _, target = head[1:].partition("@")  # Remove leading / and @botname
+        args = rest[0].split() if rest else []
+
+        # In groups, ignore commands addressed to a different bot
+        if target and target.lower() != (context.bot.username or "").lower():
+            return
 
         # Check authorization
-        if not self.auth_manager.is_authorized(user_id):
+        if not self._is_authorized(user_id):
             if self.audit_logger:
                 self.audit_logger.log_auth_attempt(user_id, False, "not in allowlist")
 
-            self.auth_manager.record_failed_attempt(user_id)
+            self._record_failed_attempt(user_id)
 
             if self.auth_manager.is_rate_limited(user_id):
-                await update.message.reply_text("Too many failed attempts. Please try again later.")
+                await msg.reply_text("Too many failed attempts. Please try again later.")
             else:
-                await update.message.reply_text("You are not authorized to use this bot.")
+                await msg.reply_text("You are not authorized to use this bot.")
             return
 
         # Log successful auth
@@ -169,9 +533,7 @@ class TelegramHandler:
             self.audit_logger.log_auth_attempt(user_id, True)
 
         # Update dashboard stats
-        dashboard_state.total_messages += 1
-        dashboard_state.active_users.add(user_id)
-        dashboard_state.add_activity("command", f"@{username}: /{command}", "⚡")
+        self._publish("message", user_id, "command", f"@{username}: /{command}", "⚡")
 
         # Route command — check if it's a skill with file output
         response_text = None
@@ -180,52 +542,52 @@ class TelegramHandler:
                 command,
                 user_id,
                 args,
-                message=update.message,
+                message=msg,
                 groq_api_key=getattr(self, "_groq_api_key", ""),
             )
             if result.error:
                 response_text = f"❌ {result.error}"
-                await update.message.reply_text(response_text)
+                await msg.reply_text(response_text)
             elif result.file_path:
-                from pathlib import Path
-
                 fp = Path(result.file_path)
                 caption = result.text or ""
                 response_text = caption
                 ext = fp.suffix.lower()
+                if ext in VIDEO_EXTENSIONS:
+                    reply, kind = msg.reply_video, "video"
+                elif ext in AUDIO_EXTENSIONS:
+                    reply, kind = msg.reply_audio, "audio"
+                else:
+                    reply, kind = msg.reply_document, "document"
                 try:
                     with open(fp, "rb") as f:
-                        if ext in (".mp4", ".webm", ".mkv", ".avi", ".mov"):
-                            await update.message.reply_video(
-                                video=f, caption=caption, read_timeout=120, write_timeout=120
-                            )
-                        elif ext in (".mp3", ".ogg", ".m4a", ".wav", ".flac", ".opus"):
-                            await update.message.reply_audio(
-                                audio=f, caption=caption, read_timeout=120, write_timeout=120
-                            )
-                        else:
-                            await update.message.reply_document(
-                                document=f, caption=caption, read_timeout=120, write_timeout=120
-                            )
+                        # Hand the open file to the HTTP layer, which streams it
+                        # instead of PTB reading it all into memory first
+                        upload = InputFile(f, filename=fp.name, read_file_handle=False)
+                        await reply(
+                            **{kind: upload},
+                            caption=caption,
+                            read_timeout=UPLOAD_TIMEOUT,
+                            write_timeout=UPLOAD_TIMEOUT,
+                        )
                 except Exception as e:
                     logger.error(f"Failed to send file {fp}: {e}")
-                    await update.message.reply_text(f"{caption}\n\n⚠️ File send failed: {e}")
+                    await msg.reply_text(f"{caption}\n\n⚠️ File send failed: {e}")
                 finally:
-                    # Clean up temp file
-                    try:
-                        fp.unlink(missing_ok=True)
-                    except Exception:
-                        pass
+                    # Clean up temp file, off the event loop (unlink can stall
+                    # on slow or network-mounted storage)
+                    with contextlib.suppress(OSError):
+                        await asyncio.to_thread(fp.unlink, missing_ok=True)
             else:
                 response_text = result.text or "✅ Done"
-                await update.message.reply_text(response_text)
+                await msg.reply_text(response_text)
         else:
             response_text = await self.command_router.route(command, user_id, args)
-            await update.message.reply_text(response_text)
+            await msg.reply_text(response_text)
 
         # Record message for dashboard feed
-        dashboard_state.add_message_record(
-            username, f"/{command} {' '.join(args)}".strip(), response_text or ""
+        self._publish(
+            "record", username, f"/{command} {' '.join(args)}".strip(), response_text or ""
         )
 
     async def _handle_message(
@@ -239,61 +601,127 @@ class TelegramHandler:
             update: Telegram update object
             context: Telegram context
         """
-        if not update.message or not update.message.text:
+        msg = update.message
+        if not msg or not msg.text:
             return
 
-        user_id = update.effective_user.id
-        user_message = update.message.text
-        username = update.effective_user.username or str(user_id)
+        user = update.effective_user
+        user_id = user.id
+        user_message = msg.text
+        username = user.username or str(user_id)
 
         # Check authorization
-        if not self.auth_manager.is_authorized(user_id):
+        if not self._is_authorized(user_id):
             if self.audit_logger:
                 self.audit_logger.log_auth_attempt(user_id, False, "not in allowlist")
 
-            self.auth_manager.record_failed_attempt(user_id)
-            await update.message.reply_text("You are not authorized to use this bot.")
+            self._record_failed_attempt(user_id)
+            await msg.reply_text("You are not authorized to use this bot.")
+            return
+
+        # Hold each user to their per-minute limit before spending an LLM call
+        if not self.auth_manager.allow_message(user_id):
+            logger.info(f"User {user_id} exceeded their message rate limit")
+            await msg.reply_text("You're sending messages too fast. Please wait a minute.")
             return
 
         # Update dashboard stats
-        dashboard_state.total_messages += 1
-        dashboard_state.active_users.add(user_id)
-        dashboard_state.add_activity("message", f"@{username}: {user_message[:50]}...", "💬")
+        preview = user_message if len(user_message) <= 50 else f"{user_message[:50]}..."
+        self._publish("message", user_id, "message", f"@{username}: {preview}", "💬")
+
+        # Send typing indicator alongside preparing the request, rather than
+        # paying its round trip before streaming starts
+        self._start_typing(msg.chat)
+
+        # Updates are handled concurrently, so take the user's turn first: a
+        # second message must see the first exchange in its history
+        async with self._user_lock(user_id):
+            # Get conversation context, folding the oldest messages into the
+            # summary before this turn would push them out of the store
+            history = self.context_store.get_context(user_id)
+            if len(history) + 2 > self.context_store.max_messages:
+                history = await self._fold_history(user_id, history)
+            summary = self.context_store.get_summary(user_id)
+
+            # Build messages for LLM
+            messages = [SYSTEM_MESSAGE]
+            if summary:
+                messages.append(
+                    {"role": "system", "content": f"Earlier in this conversation: {summary}"}
+                )
+            messages += [*history, {"role": "user", "content": user_message}]
+
+            try:
+                # Stream response, once a reply slot is free
+                async with self._inflight:
+                    response_text = await self._stream_response(update, messages, user_id)
+
+                # Record the exchange in one go once the reply is complete
+                if response_text:
+                    self.context_store.add_messages(
+                        user_id, [("user", user_message), ("assistant", response_text)]
+                    )
+                    # Record for dashboard feed, with a rough token estimate
+                    # (~4 chars per token); rate limit stats are refreshed
+                    # when the update is applied
+                    self._publish(
+                        "response", username, user_message, response_text,
+                        len(response_text) // 4,
+                    )
+
+            except Exception as e:
+                logger.error(f"Error generating response: {e}")
+                self._publish("activity", "error", f"Error: {str(e)[:50]}", "❌")
+                await msg.reply_text(f"Error: All providers failed. Last error: {e}")
+
+    async def _fold_history(
+        self,
+        user_id: int,
+        history: list[dict[str, str]],
+    ) -> list[dict[str, str]]:
+        """Fold the oldest messages of a user's history into their summary.
 
-        # Get conversation context
-        history = self.context_store.get_context(user_id)
+        The new summary covers the previous one plus the folded messages, and
+        is stored in place of them. If summarizing fails, the history is left
+        for the context store to truncate as before.
 
-        # Build messages for LLM
-        messages = [
-            {"role": "system", "content": "You are a helpful AI assistant."},
-        ]
-        messages.extend(history)
-        messages.append({"role": "user", "content": user_message})
+        Args:
+            user_id: Telegram user ID
+            history: User's conversation history
 
-        # Add user message to context
-        self.context_store.add_message(user_id, "user", user_message)
+        Returns:
+            History still to send word for word
+        """
+        keep = min(SUMMARY_KEEP_MESSAGES, self.context_store.max_messages // 2)
+        folded = history[: max(len(history) - keep, 0)]
+        if not folded:
+            return history
 
-        # Send typing indicator
-        await update.message.chat.send_action("typing")
+        previous = self.context_store.get_summary(user_id)
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in folded)
+        if previous:
+            transcript = f"Summary so far: {previous}\n\n{transcript}"
 
         try:
-            # Stream response
-            response_text = await self._stream_response(update, messages, user_id)
-
-            # Add assistant response to context
-            if response_text:
-                self.context_store.add_message(user_id, "assistant", response_text)
-                # Update token count (rough estimate)
-                dashboard_state.total_tokens += len(response_text.split()) * 2
-                # Update rate limit stats
-                self._update_rate_limit_stats()
-                # Record message for dashboard feed
-                dashboard_state.add_message_record(username, user_message, response_text)
-
+            # Summarizing is an LLM call too, so it waits for a reply slot
+            async with self._inflight:
+                response = await self.provider_manager.generate_with_failover(
+                    [
+                        {"role": "system", "content": SUMMARY_PROMPT},
+                        {"role": "user", "content": transcript},
+                    ],
+                    user_id,
+                )
         except Exception as e:
-            logger.error(f"Error generating response: {e}")
-            dashboard_state.add_activity("error", f"Error: {str(e)[:50]}", "❌")
-            await update.message.reply_text(f"Error: All providers failed. Last error: {e}")
+            logger.warning(f"Failed to summarize context for user {user_id}: {e}")
+            return history
+
+        summary = response.content.strip()
+        if not summary:
+            return history
+
+        self.context_store.set_summary(user_id, summary, len(folded))
+        return history[len(folded) :]
 
     async def _stream_response(
         self,
@@ -311,54 +739,50 @@ class TelegramHandler:
         Returns:
             Complete response text
         """
-        # Send initial message
-        sent_message = await update.message.reply_text("...")
+        # Send the placeholder message while the provider request starts,
+        # rather than paying its round trip before the first token
+        placeholder = asyncio.create_task(update.message.reply_text("..."))
 
+        # Chunks are only collected here; a background task pushes edits at a
+        # fixed rate so Telegram latency never stalls reading the stream
+        parts: list[str] = []
         full_response = ""
-        last_update_len = 0
-        last_update_time = asyncio.get_event_loop().time()
+        new_text = asyncio.Event()
+        stopped = asyncio.Event()
+        flusher = asyncio.create_task(self._flush_loop(placeholder, parts, new_text, stopped))
 
         try:
-            async for chunk in self.provider_manager.stream_with_failover(messages, user_id):
-                full_response += chunk
-
-                # Check if we should update the message
-                current_time = asyncio.get_event_loop().time()
-                chars_since_update = len(full_response) - last_update_len
-                time_since_update = (current_time - last_update_time) * 1000
-
-                should_update = (
-                    chars_since_update >= self.streaming_min_chars
-                    or time_since_update >= self.streaming_interval_ms
-                )
-
-                # Telegram message limit is 4096 chars - truncate if needed
-                display_text = full_response[:4000] if len(full_response) > 4000 else full_response
-
-                if should_update and display_text.strip():
-                    try:
-                        await sent_message.edit_text(display_text)
-                        last_update_len = len(full_response)
-                        last_update_time = current_time
-                    except Exception:
-                        # Ignore edit errors (e.g., message unchanged, flood control)
-                        pass
-
-            # Final update with complete response (truncated if needed)
+            try:
+                async for chunk in self.provider_manager.stream_with_failover(messages, user_id):
+                    parts.append(chunk)
+                    new_text.set()
+            finally:
+                # Stop the flusher rather than cancel it: an edit it already
+                # sent could otherwise reach Telegram after the final one
+                stopped.set()
+                new_text.set()
+                # Text the flusher left on screen (or the exception it raised)
+                [shown] = await asyncio.gather(flusher, return_exceptions=True)
+
+            sent_message = await placeholder
+            full_response = "".join(parts)
+
+            # Final update with complete response (truncated if needed),
+            # unless the flusher's last edit already shows exactly that
             if full_response.strip():
-                try:
-                    if len(full_response) > 4000:
-                        await sent_message.edit_text(
-                            full_response[:4000] + "\n\n[Message truncated...]"
-                        )
-                    else:
-                        await sent_message.edit_text(full_response)
-                except Exception:
-                    pass  # Ignore "message not modified" errors
+                cut = _display_cut(full_response)
+                if cut < len(full_response):
+                    await _edit_final(
+                        sent_message, full_response[:cut] + "\n\n[Message truncated...]"
+                    )
+                elif full_response.rstrip() != shown:
+                    await _edit_final(sent_message, full_response)
             else:
                 await sent_message.edit_text("(No response generated)")
 
         except Exception as e:
+            sent_message = await placeholder
+            full_response = "".join(parts)
             err_msg = str(e)
             # Don't treat "message not modified" as a real error
             if "message is not modified" in err_msg.lower():
@@ -367,15 +791,89 @@ class TelegramHandler:
 
             # Show partial response if available
             if full_response.strip():
-                truncated = full_response[:3900] if len(full_response) > 3900 else full_response
-                try:
-                    await sent_message.edit_text(f"{truncated}\n\n⚠️ Response interrupted: {e}")
-                except Exception:
-                    pass
+                shown = full_response[:_display_cut(full_response, INTERRUPTED_TEXT_LIMIT)]
+                await _edit_final(sent_message, f"{shown}\n\n⚠️ Response interrupted: {e}")
             else:
-                try:
-                    await sent_message.edit_text(f"Error: {e}")
-                except Exception:
-                    pass
+                await _edit_final(sent_message, f"Error: {e}")
 
         return full_response
+
+    async def _flush_loop(
+        self,
+        placeholder: asyncio.Task,
+        parts: list[str],
+        new_text: asyncio.Event,
+        stopped: asyncio.Event,
+    ) -> str:
+        """Periodically show the streamed text so far in the reply message.
+
+        Wakes at most every streaming_interval_ms, and only after new chunks
+        have arrived, then edits the message once at least streaming_min_chars
+        new characters are in and the visible text would change. Returns once
+        stopped is set, after any edit already in flight has completed.
+
+        Args:
+            placeholder: Task sending the Telegram message to edit
+            parts: Response chunks received so far (appended to by the caller)
+            new_text: Set by the caller whenever it appends to parts
+            stopped: Set by the caller when the stream has ended
+
+        Returns:
+            The text last shown in the message
+        """
+        sent_message = await placeholder
+        interval = self.streaming_interval_ms / 1000
+        last_update_len = 0
+        total_len = 0
+        counted = 0
+        shown = ""
+
+        while True:
+            # No timer wake-ups while the provider is silent (e.g. before the
+            # first token or during failover)
+            await new_text.wait()
+            # wait_for() can report a timeout even though stopped was set as
+            # it expired; clearing new_text then would lose the last wake-up
+            if await _sleep_unless(stopped, interval) or stopped.is_set():
+                return shown
+            new_text.clear()
+
+            # Track the length incrementally; only join when an edit is due
+            while counted < len(parts):
+                total_len += len(parts[counted])
+                counted += 1
+            if total_len - last_update_len < self.streaming_min_chars:
+                continue
+
+            # Telegram message limit is 4096 chars - truncate if needed, on a
+            # word boundary; this happens at most once per response. Telegram
+            # drops trailing whitespace, so chunks of only spaces or newlines
+            # don't change what is shown
+            text = "".join(parts)
+            display = text[:_display_cut(text)].rstrip()
+            if not display:
+                continue
+            if display == shown:
+                # Sending it again would only cost a round trip and a
+                # "message is not modified" error
+                last_update_len = total_len
+                continue
+
+            try:
+                await sent_message.edit_text(display)
+                last_update_len = total_len
+                shown = display
+            except RetryAfter as e:
+                # Flood control: hold off edits for as long as Telegram asks
+                if await _sleep_unless(stopped, _retry_seconds(e)):
+                    return shown
+                continue
+            except TelegramError:
+                # Ignore other edit errors (e.g., message unchanged)
+                continue
+
+            # Once the truncated prefix is shown, later edits would send the
+            # same text again ("message is not modified") and only burn flood
+            # control budget; leave the rest to the final edit
+            if last_update_len >= MESSAGE_TEXT_LIMIT:
+                return shown
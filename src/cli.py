@@ -3,10 +3,12 @@
 
 import os
 import random
+import re
 import shutil
 import subprocess
 import sys
 import time
+from itertools import accumulate
 from pathlib import Path
 
 # ═══════════════════════════════════════════════════════════════
@@ -62,6 +64,33 @@ NEON = [
 WARM = [C.PEACH, C.SALMON, C.CORAL, C.ORANGE, C.AMBER, C.GOLD]
 FIRE = [C.RED, C.NEON_ORANGE, C.ORANGE, C.AMBER, C.GOLD, C.NEON_YELLOW]
 
+# Spinner frames, each already in its neon color
+SPINNER_FRAMES = tuple(
+    f"{color}{C.BOLD}{frame}{C.END}"
+    for frame, color in zip(
+        ["◜", "◠", "◝", "◞", "◡", "◟"],
+        [C.NEON_PINK, C.NEON_ORANGE, C.NEON_YELLOW, C.NEON_GREEN, C.NEON_CYAN, C.NEON_BLUE],
+    )
+)
+
+# Seconds each spinner frame and each matrix rain row stays on screen
+SPINNER_FRAME_TIME = 0.07
+MATRIX_FRAME_TIME = 0.06
+
+# Matrix rain cells: a blank, or a glyph in one of the greens (30% of cells);
+# a whole row is drawn with one weighted random.choices() call
+MATRIX_GLYPHS = [
+    f"{color}{ch}"
+    for color in [C.NEON_GREEN, C.MINT, C.LIME, C.GREEN]
+    for ch in "01アイウエオカキクケコサシスセソ🦞"
+]
+MATRIX_CELLS = [" ", *MATRIX_GLYPHS]
+MATRIX_CUM_WEIGHTS = list(accumulate([0.7] + [0.3 / len(MATRIX_GLYPHS)] * len(MATRIX_GLYPHS)))
+
+# One typed "keystroke": a visible character with any color codes before it
+# (or trailing color codes), so escapes don't each cost a write and a pause
+TYPED_UNIT = re.compile(r"(?:\033\[[0-9;]*m)+(?:.|\Z)|.", re.DOTALL)
+
 
 # ═══════════════════════════════════════════════════════════════
 # ✨ Animation Engine
@@ -94,8 +123,8 @@ def neon_glow(text: str, color: str) -> str:
 
 def typewriter(text: str, delay: float = 0.015):
     """Type text character by character."""
-    for ch in text:
-        sys.stdout.write(ch)
+    for unit in TYPED_UNIT.findall(text):
+        sys.stdout.write(unit)
         sys.stdout.flush()
         time.sleep(delay)
     print()
@@ -103,17 +132,12 @@ def typewriter(text: str, delay: float = 0.015):
 
 def spinner(msg: str, duration: float = 1.0):
     """Neon spinner animation."""
-    frames = ["◜", "◠", "◝", "◞", "◡", "◟"]
-    colors = [C.NEON_PINK, C.NEON_ORANGE, C.NEON_YELLOW, C.NEON_GREEN, C.NEON_CYAN, C.NEON_BLUE]
-    end = time.time() + duration
-    i = 0
-    while time.time() < end:
-        c = colors[i % len(colors)]
-        f = frames[i % len(frames)]
-        sys.stdout.write(f"\r  {c}{C.BOLD}{f}{C.END} {msg}")
+    # Whole lines built up front; each tick is then a single plain write
+    lines = [f"\r  {frame} {msg}" for frame in SPINNER_FRAMES]
+    for i in range(max(1, round(duration / SPINNER_FRAME_TIME))):
+        sys.stdout.write(lines[i % len(lines)])
         sys.stdout.flush()
-        time.sleep(0.07)
-        i += 1
+        time.sleep(SPINNER_FRAME_TIME)
     sys.stdout.write(f"\r  {C.NEON_GREEN}{C.BOLD}✓{C.END} {msg}\n")
     sys.stdout.flush()
 
@@ -121,14 +145,12 @@ def spinner(msg: str, duration: float = 1.0):
 def progress_bar(msg: str, duration: float = 1.0, width: int = 30):
     """Animated neon progress bar."""
     steps = width
+    # Gradient fill, colored once; each frame joins the filled part of it
+    cells = [f"{NEON[j % len(NEON)]}█" for j in range(width)]
     for i in range(steps + 1):
         pct = i / steps
         filled = int(width * pct)
-        # Gradient fill
-        bar = ""
-        for j in range(filled):
-            bar += f"{NEON[j % len(NEON)]}█"
-        bar += f"{C.DARK}{'░' * (width - filled)}"
+        bar = "".join(cells[:filled]) + f"{C.DARK}{'░' * (width - filled)}"
         sys.stdout.write(
             f"\r  {C.GRAY}[{bar}{C.GRAY}]{C.END} {C.WHITE}{int(pct*100):3d}%{C.END} {msg}"
         )
@@ -140,18 +162,11 @@ def progress_bar(msg: str, duration: float = 1.0, width: int = 30):
 
 def matrix_rain(lines: int = 3, width: int = 60, duration: float = 0.8):
     """Quick matrix-style rain effect."""
-    chars = "01アイウエオカキクケコサシスセソ🦞"
-    end = time.time() + duration
-    while time.time() < end:
-        line = ""
-        for _ in range(width):
-            if random.random() < 0.3:
-                c = random.choice([C.NEON_GREEN, C.MINT, C.LIME, C.GREEN])
-                line += f"{c}{random.choice(chars)}"
-            else:
-                line += " "
-        print(f"  {line}{C.END}")
-        time.sleep(0.06)
+    for _ in range(max(1, round(duration / MATRIX_FRAME_TIME))):
+        cells = random.choices(MATRIX_CELLS, cum_weights=MATRIX_CUM_WEIGHTS, k=width)
+        sys.stdout.write(f"  {''.join(cells)}{C.END}\n")
+        sys.stdout.flush()
+        time.sleep(MATRIX_FRAME_TIME)
 
 
 def pulse_text(text: str, cycles: int = 2):
@@ -390,15 +405,17 @@ def configure_env_interactive():
     input(f"\n  {C.DARK}Press Enter to continue...{C.END}")
 
 
+# KEY=value lines of a .env file (anything but comments), matched in one scan
+ENV_LINE = re.compile(r"^(?!#)([^=\n]*)=(.*)$", re.MULTILINE)
+
+
 def _load_env(env_file: Path) -> dict:
     """Load existing .env values into a dict."""
-    existing = {}
-    if env_file.exists():
-        for line in env_file.read_text().splitlines():
-            if "=" in line and not line.startswith("#"):
-                key, _, value = line.partition("=")
-                existing[key.strip()] = value.strip()
-    return existing
+    if not env_file.exists():
+        return {}
+    return {
+        key.strip(): value.strip() for key, value in ENV_LINE.findall(env_file.read_text())
+    }
 
 
 def _save_env(env_file: Path, existing: dict):
@@ -602,18 +619,15 @@ def show_current_config(env_file: Path):
     if not env_file.exists():
         warn("No .env file found")
         return
-    for line in env_file.read_text().splitlines():
-        if "=" in line and not line.startswith("#"):
-            key, _, value = line.partition("=")
-            key, value = key.strip(), value.strip()
-            if value and len(value) > 10:
-                masked = f"{value[:5]}{'*' * 10}{value[-3:]}"
-            elif value:
-                masked = "*" * len(value)
-            else:
-                masked = f"{C.DIM}(not set){C.END}"
-            icon = f"{C.NEON_GREEN}✓{C.END}" if value else f"{C.RED}✗{C.END}"
-            print(f"    {icon} {C.NEON_CYAN}{key}{C.END}: {masked}")
+    for key, value in _load_env(env_file).items():
+        if value and len(value) > 10:
+            masked = f"{value[:5]}{'*' * 10}{value[-3:]}"
+        elif value:
+            masked = "*" * len(value)
+        else:
+            masked = f"{C.DIM}(not set){C.END}"
+        icon = f"{C.NEON_GREEN}✓{C.END}" if value else f"{C.RED}✗{C.END}"
+        print(f"    {icon} {C.NEON_CYAN}{key}{C.END}: {masked}")
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -698,19 +712,14 @@ def check_status():
     env_file = config_dir / ".env"
     if env_file.exists():
         print(f"\n  {C.BOLD}🔑 API Keys{C.END}\n")
-        content = env_file.read_text()
+        env = _load_env(env_file)
         for key, name in [
             ("TELEGRAM_BOT_TOKEN", "Telegram Token"),
             ("GROQ_API_KEY", "Groq API Key"),
             ("OLLAMA_CLOUD_URL", "Ollama Cloud URL"),
             ("OLLAMA_API_KEY", "Ollama API Key"),
         ]:
-            has_value = False
-            for line in content.splitlines():
-                if line.startswith(f"{key}="):
-                    value = line.split("=", 1)[1].strip()
-                    has_value = bool(value)
-                    break
+            has_value = bool(env.get(key))
             icon = f"{C.NEON_GREEN}●{C.END}" if has_value else f"{C.NEON_YELLOW}●{C.END}"
             state = (
                 f"{C.NEON_GREEN}Configured{C.END}"
@@ -749,6 +758,10 @@ def run_tests():
     progress_bar("Loading test suite", 0.6)
     print()
 
+    # pytest writes straight to our stdout (the cheapest path, and it keeps
+    # its colors); flush first so output redirected to a file or pipe stays
+    # in order
+    sys.stdout.flush()
     result = subprocess.run(
         [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short"],
         cwd=project_dir,
@@ -787,17 +800,10 @@ def start_bot():
             return
 
     # Check required values
-    env_content = env_file.read_text()
-
-    def _env_has(key):
-        for line in env_content.splitlines():
-            if line.startswith(f"{key}="):
-                return bool(line.split("=", 1)[1].strip())
-        return False
-
-    has_telegram = _env_has("TELEGRAM_BOT_TOKEN")
-    has_groq = _env_has("GROQ_API_KEY")
-    has_ollama = _env_has("OLLAMA_API_KEY")
+    env = _load_env(env_file)
+    has_telegram = bool(env.get("TELEGRAM_BOT_TOKEN"))
+    has_groq = bool(env.get("GROQ_API_KEY"))
+    has_ollama = bool(env.get("OLLAMA_API_KEY"))
 
     missing = []
     if not has_telegram:
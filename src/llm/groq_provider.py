@@ -47,7 +47,7 @@ class GroqProvider(BaseProvider):
             LLMResponse with generated content
         """
         model = model or self._default_model
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             response = await self.client.chat.completions.create(
@@ -57,7 +57,7 @@ class GroqProvider(BaseProvider):
                 max_tokens=2048,
             )
 
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic() - start_time) * 1000
             self.last_latency_ms = latency_ms
             self.mark_healthy()
 
@@ -101,7 +101,7 @@ class GroqProvider(BaseProvider):
             Response content chunks as strings
         """
         model = model or self._default_model
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             stream = await self.client.chat.completions.create(
@@ -116,7 +116,7 @@ class GroqProvider(BaseProvider):
                 if chunk.choices and chunk.choices[0].delta.content:
                     yield chunk.choices[0].delta.content
 
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic() - start_time) * 1000
             self.last_latency_ms = latency_ms
             self.mark_healthy()
 
@@ -56,7 +56,7 @@ class OllamaCloudProvider(BaseProvider):
         logger.debug(
             f"OllamaCloud generating with model='{model}' (default='{self._default_model}')"
         )
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             response = await self.client.chat(
@@ -64,7 +64,7 @@ class OllamaCloudProvider(BaseProvider):
                 messages=messages,
             )
 
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic() - start_time) * 1000
             self.last_latency_ms = latency_ms
             self.mark_healthy()
 
@@ -105,7 +105,7 @@ class OllamaCloudProvider(BaseProvider):
         logger.debug(
             f"OllamaCloud streaming with model='{model}' (default='{self._default_model}')"
         )
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             stream = await self.client.chat(
@@ -118,7 +118,7 @@ class OllamaCloudProvider(BaseProvider):
                 if chunk.get("message", {}).get("content"):
                     yield chunk["message"]["content"]
 
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic() - start_time) * 1000
             self.last_latency_ms = latency_ms
             self.mark_healthy()
 
@@ -45,7 +45,7 @@ class LocalOllamaProvider(BaseProvider):
             LLMResponse with generated content
         """
         model = model or self._default_model
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             response = await self.client.chat(
@@ -53,7 +53,7 @@ class LocalOllamaProvider(BaseProvider):
                 messages=messages,
             )
 
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic() - start_time) * 1000
             self.last_latency_ms = latency_ms
             self.mark_healthy()
 
@@ -90,7 +90,7 @@ class LocalOllamaProvider(BaseProvider):
             Response content chunks as strings
         """
         model = model or self._default_model
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             stream = await self.client.chat(
@@ -103,7 +103,7 @@ class LocalOllamaProvider(BaseProvider):
                 if chunk.get("message", {}).get("content"):
                     yield chunk["message"]["content"]
 
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic() - start_time) * 1000
             self.last_latency_ms = latency_ms
             self.mark_healthy()
 
@@ -15,6 +15,7 @@ from .llm.ollama_local_provider import LocalOllamaProvider
 from .llm.provider_manager import ProviderManager
 from .llm.rate_limiter import RateLimitConfig, RateLimiter
 from .security.auth import AuthManager, AuthSettings
+from .skills.http_client import close_http_client
 from .skills.registry import SkillRegistry
 from .utils.audit_logger import AuditLogger
 from .utils.config_manager import ConfigManager
@@ -182,6 +183,11 @@ async def main() -> None:
         streaming_interval_ms=app_config.streaming_update_interval_ms,
         streaming_min_chars=app_config.streaming_min_chunk_chars,
         skill_registry=skill_registry,
+        webhook_url=app_config.webhook_url,
+        webhook_listen=app_config.webhook_listen,
+        webhook_port=app_config.webhook_port,
+        webhook_secret=app_config.webhook_secret,
+        api_base_url=app_config.telegram_api_base_url,
     )
     _handler._groq_api_key = app_config.groq_api_key or ""
 
@@ -216,8 +222,12 @@ async def main() -> None:
     )
     logger.info(f"Dashboard started at http://0.0.0.0:{dashboard_port}")
 
-    # Setup shutdown event
+    # Setup shutdown event, set from the event loop itself on SIGINT/SIGTERM
+    # (as Application.run_polling does) so the wait below wakes at once
     _shutdown_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, handle_shutdown, signum)
 
     # Start bot
     await _handler.start()
@@ -229,11 +239,12 @@ async def main() -> None:
     logger.info("Shutting down...")
     dashboard_state.bot_running = False
     await _handler.stop()
+    await close_http_client()
     audit_logger.log_shutdown("normal")
     logger.info("Shutdown complete")
 
 
-def handle_shutdown(signum, frame):
+def handle_shutdown(signum: int) -> None:
     """Handle shutdown signals."""
     logger.info(f"Received signal {signum}, initiating shutdown...")
     if _shutdown_event:
@@ -242,9 +253,6 @@ def handle_shutdown(signum, frame):
 
 def run():
     """Entry point for running the bot."""
-    signal.signal(signal.SIGINT, handle_shutdown)
-    signal.signal(signal.SIGTERM, handle_shutdown)
-
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
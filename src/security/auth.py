@@ -1,9 +1,11 @@
 """Authentication and authorization for OpenClaw Telegram Bot."""
 
 import logging
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Hashable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,12 @@ PERMISSION_LEVELS = {
     "admin": 3,
 }
 
+# Seconds a cached authorization decision is reused before asking again
+DECISION_CACHE_TTL = 5.0
+
+# Seconds over which a user's messages count against their per-minute rate limit
+MESSAGE_RATE_WINDOW = 60.0
+
 
 @dataclass
 class UserPermission:
@@ -37,6 +45,79 @@ class AuthSettings:
     lockout_duration_minutes: int = 15
 
 
+class DecisionCache:
+    """Short-lived cache of authorization decisions.
+
+    Saves re-running AuthManager checks on every update from an active user.
+    Expired entries are dropped at most once per TTL, so only recently seen
+    users are held, even when unknown users are allowed.
+    """
+
+    def __init__(self, ttl: float = DECISION_CACHE_TTL):
+        """Initialize DecisionCache.
+
+        Args:
+            ttl: Seconds a decision is reused
+        """
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, bool]] = {}
+        self._next_prune = 0.0
+        self._version: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[bool]:
+        """Get a cached decision.
+
+        Args:
+            key: Cache key, e.g. a user ID
+
+        Returns:
+            The decision, or None if there is no fresh one
+        """
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return None
+        return entry[1]
+
+    def put(self, key: Hashable, allowed: bool) -> None:
+        """Cache a decision.
+
+        Args:
+            key: Cache key, e.g. a user ID
+            allowed: The decision
+        """
+        now = time.monotonic()
+        if now >= self._next_prune:
+            cutoff = now - self.ttl
+            self._entries = {k: e for k, e in self._entries.items() if e[0] > cutoff}
+            self._next_prune = now + self.ttl
+        self._entries[key] = (now, allowed)
+
+    def check_version(self, version: int) -> None:
+        """Drop all decisions if the permissions behind them have changed.
+
+        Args:
+            version: Current AuthManager.version
+        """
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+
+    def discard(self, key: Hashable) -> None:
+        """Forget one decision.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget all decisions (e.g. after permissions change)."""
+        self._entries.clear()
+
+
 class AuthManager:
     """Handles user authentication and authorization."""
 
@@ -54,9 +135,15 @@ class AuthManager:
         self.permissions = permissions
         self.settings = settings or AuthSettings()
         self.failed_attempts: dict[int, list[datetime]] = {}
+        self.message_times: dict[int, deque[float]] = {}
+        self._next_message_sweep = 0.0
         self._user_cache: dict[int, UserPermission] = {}
         self._build_user_cache()
 
+        # Bumped whenever permissions are reloaded, so cached decisions
+        # (see DecisionCache) can tell they are stale
+        self.version = 0
+
     def _build_user_cache(self) -> None:
         """Build user permission cache with rate limits."""
         self._user_cache = {}
@@ -82,6 +169,7 @@ class AuthManager:
         """
         self.permissions = permissions
         self._build_user_cache()
+        self.version += 1
         logger.info(f"Reloaded permissions for {len(permissions)} users")
 
     def is_authorized(self, user_id: int) -> bool:
@@ -154,6 +242,40 @@ class AuthManager:
 
         return self.settings.guest_rate_limit
 
+    def allow_message(self, user_id: int) -> bool:
+        """Count a message against the user's rate limit, if it allows one.
+
+        Args:
+            user_id: Telegram user ID
+
+        Returns:
+            True if the message is within the limit and was counted
+        """
+        now = time.monotonic()
+        cutoff = now - MESSAGE_RATE_WINDOW
+
+        # Drop users with no messages left in the window, at most once per
+        # window, so only recently active users are held
+        if now >= self._next_message_sweep:
+            self.message_times = {
+                uid: times
+                for uid, times in self.message_times.items()
+                if times and times[-1] > cutoff
+            }
+            self._next_message_sweep = now + MESSAGE_RATE_WINDOW
+
+        times = self.message_times.setdefault(user_id, deque())
+
+        # Forget messages that have left the window
+        while times and times[0] <= cutoff:
+            times.popleft()
+
+        if len(times) >= self.get_rate_limit(user_id):
+            return False
+
+        times.append(now)
+        return True
+
     def record_failed_attempt(self, user_id: int) -> None:
         """Record a failed authentication attempt.
 
@@ -5,6 +5,7 @@ import httpx
 import importlib.util
 
 from src.skills.base_skill import BaseSkill, SkillResult
+from src.skills.http_client import get_http_client
 
 # Common aliases so users can type /crypto btc instead of /crypto bitcoin
 ALIASES = {
@@ -52,10 +53,11 @@ class CryptoSkill(BaseSkill):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.get(url, params=params, headers={"User-Agent": "OpenClaw-Bot"})
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client().get(
+                url, params=params, headers={"User-Agent": "OpenClaw-Bot"}, timeout=10
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             name = data.get("name", coin_id)
             symbol = data.get("symbol", "?").upper()
@@ -0,0 +1,65 @@
+"""Shared HTTP client for skills that call web APIs.
+
+Skills used to open a fresh httpx.AsyncClient per command, paying a TCP and
+TLS handshake on every call. A single pooled client keeps connections to
+wttr.in, Wikipedia, CoinGecko etc. alive between commands.
+"""
+
+import asyncio
+import contextlib
+from typing import Optional
+
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Tasks closing clients left over from an earlier event loop
+_retiring: set[asyncio.Task] = set()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared client, creating it on first use.
+
+    The client's connections belong to the event loop that opened them, so a
+    new client is created if called from a different loop, and the old one
+    is closed in the background.
+
+    Returns:
+        Pooled AsyncClient. Pass timeout/follow_redirects per request.
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None and not _client.is_closed:
+            task = loop.create_task(_close_stale_client(_client))
+            _retiring.add(task)
+            task.add_done_callback(_retiring.discard)
+        _client = httpx.AsyncClient()
+        _client_loop = loop
+    return _client
+
+
+async def _close_stale_client(client: httpx.AsyncClient) -> None:
+    """Close a client from an earlier event loop.
+
+    Closing empties its connection pool first, so the connections are released
+    even if the loop that opened them is already closed and shutting them down
+    cleanly fails.
+
+    Args:
+        client: Client to close
+    """
+    with contextlib.suppress(RuntimeError):  # "Event loop is closed"
+        await client.aclose()
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its pooled connections."""
+    global _client, _client_loop
+
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
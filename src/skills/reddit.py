@@ -13,6 +13,7 @@ import httpx
 import importlib.util
 
 from src.skills.base_skill import BaseSkill, SkillResult
+from src.skills.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +39,7 @@ class RedditSkill(BaseSkill):
 
     async def _get_token(self) -> str:
         """Get or refresh OAuth2 app-only access token."""
-        if self._token and time.time() < self._token_expires - 60:
+        if self._token and time.monotonic() < self._token_expires - 60:
             return self._token
 
         if not self._client_id or not self._client_secret:
@@ -49,35 +50,35 @@ class RedditSkill(BaseSkill):
                 "3. Add REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET to config/.env"
             )
 
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.post(
-                TOKEN_URL,
-                auth=(self._client_id, self._client_secret),
-                data={"grant_type": "client_credentials"},
-                headers={"User-Agent": USER_AGENT},
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await get_http_client().post(
+            TOKEN_URL,
+            auth=(self._client_id, self._client_secret),
+            data={"grant_type": "client_credentials"},
+            headers={"User-Agent": USER_AGENT},
+            timeout=10,
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         self._token = data["access_token"]
-        self._token_expires = time.time() + data.get("expires_in", 3600)
+        self._token_expires = time.monotonic() + data.get("expires_in", 3600)
         return self._token
 
     async def _api_get(self, path: str, params: dict | None = None) -> dict:
         """Make authenticated GET request to Reddit API."""
         token = await self._get_token()
         url = f"{API_BASE}{path}"
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(
-                url,
-                params=params or {},
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "User-Agent": USER_AGENT,
-                },
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = await get_http_client().get(
+            url,
+            params=params or {},
+            headers={
+                "Authorization": f"Bearer {token}",
+                "User-Agent": USER_AGENT,
+            },
+            timeout=10,
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     async def execute(self, user_id: int, args: list[str], **kwargs) -> SkillResult:
         if not self._client_id:
@@ -49,7 +49,7 @@ class SkillRegistry:
 
         for importer, module_name, is_pkg in pkgutil.iter_modules(package_path):
             # Skip internal modules
-            if module_name.startswith("_") or module_name in ("base_skill", "registry"):
+            if module_name.startswith("_") or module_name in ("base_skill", "registry", "http_client"):
                 continue
 
             full_module_name = f"{package_name}.{module_name}"
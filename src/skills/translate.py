@@ -5,6 +5,7 @@ import httpx
 import importlib.util
 
 from src.skills.base_skill import BaseSkill, SkillResult
+from src.skills.http_client import get_http_client
 
 # Common language codes for quick reference
 LANG_ALIASES = {
@@ -74,14 +75,14 @@ class TranslateSkill(BaseSkill):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                resp = await client.post(
-                    url,
-                    json=payload,
-                    headers={"User-Agent": "OpenClaw-Bot"},
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client().post(
+                url,
+                json=payload,
+                headers={"User-Agent": "OpenClaw-Bot"},
+                timeout=15,
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             translated = data.get("translatedText", "")
             detected_lang = data.get("detectedLanguage", {}).get("language", "auto")
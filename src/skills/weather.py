@@ -5,6 +5,7 @@ import httpx
 import importlib.util
 
 from src.skills.base_skill import BaseSkill, SkillResult
+from src.skills.http_client import get_http_client
 
 
 
@@ -25,10 +26,11 @@ class WeatherSkill(BaseSkill):
         url = f"{api_url}/{location}?format=j1"
 
         try:
-            async with httpx.AsyncClient(timeout=15, follow_redirects=True) as client:
-                resp = await client.get(url, headers={"User-Agent": "OpenClaw-Bot"})
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client().get(
+                url, headers={"User-Agent": "OpenClaw-Bot"}, timeout=15, follow_redirects=True
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             current = data.get("current_condition", [{}])[0]
             area = data.get("nearest_area", [{}])[0]
@@ -5,6 +5,7 @@ import httpx
 import importlib.util
 
 from src.skills.base_skill import BaseSkill, SkillResult
+from src.skills.http_client import get_http_client
 
 
 class WikiSkill(BaseSkill):
@@ -24,10 +25,11 @@ class WikiSkill(BaseSkill):
         url = f"https://{lang}.wikipedia.org/api/rest_v1/page/summary/{query}"
 
         try:
-            async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
-                resp = await client.get(url, headers={"User-Agent": "OpenClaw-Bot"})
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client().get(
+                url, headers={"User-Agent": "OpenClaw-Bot"}, timeout=10, follow_redirects=True
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             title = data.get("title", query)
             extract = data.get("extract", "")
@@ -84,8 +84,7 @@ class YtdlSkill(BaseSkill):
                     pass
 
         # Auto-update yt-dlp in background
-        loop = asyncio.get_event_loop()
-        loop.run_in_executor(None, _auto_update_ytdlp)
+        asyncio.get_running_loop().run_in_executor(None, _auto_update_ytdlp)
 
         # Build yt-dlp command
         output_template = os.path.join(temp_dir, "%(id)s.%(ext)s")
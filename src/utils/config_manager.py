@@ -40,6 +40,13 @@ class AppConfig:
     streaming_update_interval_ms: int = 500
     streaming_min_chunk_chars: int = 50
 
+    # Telegram transport settings (webhook instead of polling when url is set)
+    webhook_url: Optional[str] = None
+    webhook_listen: str = "0.0.0.0"
+    webhook_port: int = 8443
+    webhook_secret: Optional[str] = None
+    telegram_api_base_url: Optional[str] = None
+
 
 @dataclass
 class ProviderConfig:
@@ -170,6 +177,7 @@ class ConfigManager:
         bot = config_data.get("bot", {})
         logging_cfg = config_data.get("logging", {})
         streaming = config_data.get("streaming", {})
+        telegram = config_data.get("telegram", {})
 
         self.app_config = AppConfig(
             # Secrets from environment
@@ -192,6 +200,12 @@ class ConfigManager:
             # Streaming
             streaming_update_interval_ms=streaming.get("update_interval_ms", 500),
             streaming_min_chunk_chars=streaming.get("min_chunk_chars", 50),
+            # Telegram transport
+            webhook_url=telegram.get("webhook_url") or None,
+            webhook_listen=telegram.get("webhook_listen", "0.0.0.0"),
+            webhook_port=telegram.get("webhook_port", 8443),
+            webhook_secret=os.getenv("TELEGRAM_WEBHOOK_SECRET") or None,
+            telegram_api_base_url=telegram.get("api_base_url") or None,
         )
 
     def _parse_permissions(self, data: dict[str, Any]) -> None:
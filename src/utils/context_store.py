@@ -18,6 +18,7 @@ class ConversationContext:
     created_at: str = ""
     updated_at: str = ""
     total_tokens: int = 0
+    summary: str = ""
 
     def __post_init__(self):
         if not self.created_at:
@@ -47,6 +48,9 @@ class ContextStore:
         self.max_tokens = max_tokens
         self.contexts: dict[int, ConversationContext] = {}
 
+        # Set when contexts change, cleared when a snapshot is taken to save
+        self.dirty = False
+
     def get_context(self, user_id: int) -> list[dict[str, str]]:
         """Get conversation history for user.
 
@@ -61,6 +65,40 @@ class ContextStore:
 
         return self.contexts[user_id].messages.copy()
 
+    def get_summary(self, user_id: int) -> str:
+        """Get the summary of the user's older, folded-away messages.
+
+        Args:
+            user_id: Telegram user ID
+
+        Returns:
+            Summary text, or an empty string if nothing has been summarized
+        """
+        if user_id not in self.contexts:
+            return ""
+
+        return self.contexts[user_id].summary
+
+    def set_summary(self, user_id: int, summary: str, folded: int) -> None:
+        """Replace the user's oldest messages with a summary of them.
+
+        The summary is kept and reused on later turns, so those messages
+        are only summarized once.
+
+        Args:
+            user_id: Telegram user ID
+            summary: Summary covering the earlier summary and folded messages
+            folded: Number of oldest messages the summary replaces
+        """
+        if user_id not in self.contexts:
+            self.contexts[user_id] = ConversationContext(user_id=user_id)
+
+        context = self.contexts[user_id]
+        context.summary = summary
+        del context.messages[:folded]
+        context.updated_at = datetime.now().isoformat()
+        self.dirty = True
+
     def add_message(
         self,
         user_id: int,
@@ -76,13 +114,29 @@ class ContextStore:
             content: Message content
             tokens: Token count for this message
         """
+        self.add_messages(user_id, [(role, content)], tokens)
+
+    def add_messages(
+        self,
+        user_id: int,
+        messages: list[tuple[str, str]],
+        tokens: int = 0,
+    ) -> None:
+        """Add several messages to user's context at once.
+
+        Args:
+            user_id: Telegram user ID
+            messages: (role, content) pairs, oldest first
+            tokens: Token count for all of the messages
+        """
         if user_id not in self.contexts:
             self.contexts[user_id] = ConversationContext(user_id=user_id)
 
         context = self.contexts[user_id]
-        context.messages.append({"role": role, "content": content})
+        context.messages.extend({"role": role, "content": content} for role, content in messages)
         context.total_tokens += tokens
         context.updated_at = datetime.now().isoformat()
+        self.dirty = True
 
         # Truncate if needed
         self._truncate_context(context)
@@ -95,6 +149,7 @@ class ContextStore:
         """
         if user_id in self.contexts:
             del self.contexts[user_id]
+            self.dirty = True
             logger.debug(f"Cleared context for user {user_id}")
 
     def _truncate_context(self, context: ConversationContext) -> None:
@@ -115,14 +170,32 @@ class ContextStore:
 
     def save_to_disk(self) -> None:
         """Persist all contexts to disk."""
-        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        self.write_snapshot(self.snapshot())
+
+    def snapshot(self) -> dict[str, dict]:
+        """Copy all contexts for saving and mark the store clean.
+
+        Taking the copy on the thread that changes the store lets
+        write_snapshot() run in another thread meanwhile.
+
+        Returns:
+            Contexts as written to disk, keyed by user ID
+        """
+        self.dirty = False
+        return {str(user_id): asdict(context) for user_id, context in self.contexts.items()}
+
+    def write_snapshot(self, data: dict[str, dict]) -> None:
+        """Write a snapshot of the contexts to disk.
 
-        data = {str(user_id): asdict(context) for user_id, context in self.contexts.items()}
+        Args:
+            data: Contexts from snapshot()
+        """
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(self.storage_path, "w") as f:
             json.dump(data, f, indent=2, default=str)
 
-        logger.debug(f"Saved {len(self.contexts)} contexts to {self.storage_path}")
+        logger.debug(f"Saved {len(data)} contexts to {self.storage_path}")
 
     def load_from_disk(self) -> None:
         """Load contexts from disk."""
@@ -143,6 +216,7 @@ class ContextStore:
                     created_at=context_data.get("created_at", ""),
                     updated_at=context_data.get("updated_at", ""),
                     total_tokens=context_data.get("total_tokens", 0),
+                    summary=context_data.get("summary", ""),
                 )
 
             logger.info(f"Loaded {len(self.contexts)} contexts from {self.storage_path}")
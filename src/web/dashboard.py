@@ -1,6 +1,9 @@
 """Web dashboard for OpenClaw bot monitoring."""
 
+import hashlib
+import math
 import threading
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
@@ -18,6 +21,45 @@ class MessageRecord:
     timestamp: str  # ISO format string
 
 
+class UniqueCounter:
+    """Approximate count of distinct items in fixed memory (HyperLogLog).
+
+    Keeps 2**precision one-byte registers (4 KiB by default) however many
+    items are added. Small counts are near exact; large ones are typically
+    within a few percent.
+    """
+
+    __slots__ = ("_precision", "_registers")
+
+    def __init__(self, precision: int = 12):
+        self._precision = precision
+        self._registers = bytearray(1 << precision)
+
+    def add(self, item) -> None:
+        """Count an item (hashed via its str form)."""
+        digest = hashlib.blake2b(str(item).encode(), digest_size=8).digest()
+        x = int.from_bytes(digest, "big")
+        bits = 64 - self._precision
+        index = x >> bits
+        rank = bits - (x & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def update(self, items) -> None:
+        """Count each of the given items."""
+        for item in items:
+            self.add(item)
+
+    def __len__(self) -> int:
+        m = len(self._registers)
+        estimate = 0.7213 / (1 + 1.079 / m) * m * m / sum(2.0**-r for r in self._registers)
+        zeros = self._registers.count(0)
+        if zeros and estimate <= 2.5 * m:
+            # Linear counting is more accurate while many registers are empty
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+
 class DashboardState:
     """Shared state between bot and dashboard."""
 
@@ -26,9 +68,9 @@ class DashboardState:
         self.bot_running: bool = False
         self.total_messages: int = 0
         self.total_tokens: int = 0
-        self.active_users: set = set()
+        self.active_users = UniqueCounter()  # Bounded memory with unknown users allowed
         self.providers: dict = {}
-        self.recent_activity: list = []
+        self.recent_activity: deque = deque(maxlen=50)  # Oldest entries drop off
         self.rate_limits: dict = {}
         self.skill_registry = None  # Set by main.py after skill loading
         self.message_feed: list[MessageRecord] = []
@@ -48,7 +90,7 @@ class DashboardState:
             "total_tokens": self.total_tokens,
             "active_users": len(self.active_users),
             "providers": self._get_live_providers(),
-            "recent_activity": self.recent_activity[-10:],
+            "recent_activity": list(self.recent_activity)[-10:],
             "rate_limits": self.rate_limits,
             "skills": self._get_skill_stats(),
         }
@@ -73,8 +115,6 @@ class DashboardState:
                 "time": datetime.now().strftime("%H:%M:%S"),
             }
         )
-        if len(self.recent_activity) > 50:
-            self.recent_activity = self.recent_activity[-50:]
 
     def add_message_record(self, username: str, user_message: str, bot_response: str) -> None:
         """Record a message exchange. Capped at 100 records."""
@@ -5,11 +5,13 @@ Tests Properties 13 and 14 from the design document.
 """
 
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 
 import pytest
 from hypothesis import given, settings, strategies as st, HealthCheck
 
-from src.security.auth import AuthManager, AuthSettings, PERMISSION_LEVELS
+from src.security import auth
+from src.security.auth import AuthManager, AuthSettings, DecisionCache, PERMISSION_LEVELS
 
 
 # Strategies
@@ -250,3 +252,64 @@ class TestAuthFailureRateLimiting:
         # user1 should be limited, user2 should not
         assert manager.is_rate_limited(user_id1) is True
         assert manager.is_rate_limited(user_id2) is False
+
+
+class TestDecisionCache:
+    """Cached auth decisions expire, and expired ones are not kept around."""
+
+    @given(user_ids=st.lists(user_id_strategy, min_size=1, max_size=50, unique=True))
+    @settings(max_examples=50)
+    def test_only_recent_decisions_held(self, user_ids):
+        now = [0.0]
+        cache = DecisionCache(ttl=5.0)
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(auth, "time", SimpleNamespace(monotonic=lambda: now[0]))
+            for user_id in user_ids:
+                cache.put(user_id, True)
+                assert cache.get(user_id) is True
+
+            # Past the TTL every decision is stale, and the next put prunes them
+            now[0] += 5.0
+            assert all(cache.get(user_id) is None for user_id in user_ids)
+            cache.put(0, False)
+
+            assert len(cache) == 1
+            assert cache.get(0) is False
+
+
+class TestMessageRateLimit:
+    """Each user may send at most their per-minute limit of messages."""
+
+    @given(limit=st.integers(min_value=1, max_value=20), extra=st.integers(min_value=1, max_value=5))
+    @settings(max_examples=50)
+    def test_limit_applies_within_the_window(self, limit, extra):
+        now = [0.0]
+        manager = AuthManager({1: "user"}, AuthSettings(user_rate_limit=limit))
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(auth, "time", SimpleNamespace(monotonic=lambda: now[0]))
+            allowed = [manager.allow_message(1) for _ in range(limit + extra)]
+            assert allowed == [True] * limit + [False] * extra
+
+            # Other users have their own allowance
+            assert manager.allow_message(2)
+
+            # Once the window has passed the user may send again
+            now[0] += auth.MESSAGE_RATE_WINDOW
+            assert manager.allow_message(1)
+
+    @given(user_ids=st.lists(user_id_strategy, min_size=1, max_size=50, unique=True))
+    @settings(max_examples=50)
+    def test_idle_users_dropped_after_the_window(self, user_ids):
+        now = [0.0]
+        manager = AuthManager({}, AuthSettings(allow_unknown_users=True))
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(auth, "time", SimpleNamespace(monotonic=lambda: now[0]))
+            for user_id in user_ids:
+                assert manager.allow_message(user_id)
+            assert len(manager.message_times) == len(user_ids)
+
+            # Once the window has passed, the next message sweeps the idle users
+            now[0] += auth.MESSAGE_RATE_WINDOW
+            assert manager.allow_message(0)
+
+            assert list(manager.message_times) == [0]
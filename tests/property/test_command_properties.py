@@ -184,3 +184,47 @@ class TestAdminCommandPermissionEnforcement:
         
         # Should be rejected
         assert "permission" in response.lower() or "don't have" in response.lower()
+
+
+class TestPermissionCache:
+    """Cached permission checks stay consistent with AuthManager."""
+
+    @given(
+        user_id=user_id_strategy,
+        old_level=permission_level,
+        new_level=permission_level,
+    )
+    @settings(max_examples=50, deadline=None)
+    @pytest.mark.asyncio
+    async def test_cache_cleared_on_permission_change(self, user_id, old_level, new_level):
+        """After clearing the cache, available commands follow the new level."""
+        auth_manager = create_auth_manager({user_id: old_level})
+        router = CommandRouter(auth_manager)
+        router.get_available_commands(user_id)
+
+        auth_manager.load_permissions({user_id: new_level})
+        router.clear_permission_cache()
+
+        available = {h.name for h in router.get_available_commands(user_id)}
+        expected = {
+            name for name, h in router.handlers.items()
+            if auth_manager.check_permission(user_id, h.permission_level)
+        }
+        assert available == expected
+
+    @given(user_id=user_id_strategy, level=permission_level)
+    @settings(max_examples=30, deadline=None)
+    @pytest.mark.asyncio
+    async def test_help_includes_commands_registered_later(self, user_id, level):
+        """Registering a command invalidates the cached /help text."""
+        router = CommandRouter(create_auth_manager({user_id: level}))
+        before = await router.route("help", user_id, [])
+
+        async def noop(uid, args):
+            return ""
+
+        router.register("zzlate", noop, "guest", "Registered late")
+        after = await router.route("help", user_id, [])
+
+        assert "/zzlate" not in before
+        assert after.endswith("/zzlate - Registered late")
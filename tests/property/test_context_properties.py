@@ -265,6 +265,31 @@ class TestContextPersistenceRoundTrip:
                     assert loaded["role"] == exp["role"]
                     assert loaded["content"] == exp["content"]
     
+    @given(
+        user_id=user_id_strategy,
+        summary=message_content(),
+        folded=st.integers(min_value=0, max_value=4),
+    )
+    @settings(max_examples=30, deadline=None)
+    def test_summary_survives_save_load(self, user_id, summary, folded):
+        """Folded messages stay replaced by their summary after a restart."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage_path = Path(tmpdir) / "contexts.json"
+
+            store1 = ContextStore(str(storage_path))
+            for i in range(4):
+                store1.add_message(user_id, "user", f"msg_{i}")
+            store1.set_summary(user_id, summary, folded)
+            store1.save_to_disk()
+
+            store2 = ContextStore(str(storage_path))
+            store2.load_from_disk()
+
+            assert store2.get_summary(user_id) == summary
+            assert [m["content"] for m in store2.get_context(user_id)] == [
+                f"msg_{i}" for i in range(folded, 4)
+            ]
+
     @given(
         user_id=user_id_strategy,
     )
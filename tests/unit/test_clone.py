@@ -1,5 +1,6 @@
 """Unit tests for the clone script."""
 
+import shutil
 import tarfile
 import tempfile
 from pathlib import Path
@@ -7,6 +8,8 @@ from pathlib import Path
 import pytest
 
 from scripts.clone import (
+    PARALLEL_SCAN_MIN_FILES,
+    SCAN_CHUNK_SIZE,
     CloneExporter,
     collect_files,
     content_contains_secrets,
@@ -114,6 +117,29 @@ class TestFileContainsSecrets:
         missing = tmp_path / "nonexistent.txt"
         assert file_contains_secrets(missing) is False
 
+    def test_binary_extension_not_scanned(self, tmp_path):
+        image = tmp_path / "logo.png"
+        image.write_text(
+            "gsk_aB1cD2eF3gH4iJ5kL6mN7oP8qR9sT0uV1wX2yZ3aB4cD5eF6gH7"
+        )
+        assert file_contains_secrets(image) is False
+
+    def test_oversized_file_scanned_in_chunks(self, tmp_path):
+        big = tmp_path / "dump.txt"
+        big.write_bytes(
+            b"x" * SCAN_CHUNK_SIZE
+            + b"gsk_aB1cD2eF3gH4iJ5kL6mN7oP8qR9sT0uV1wX2yZ3aB4cD5eF6gH7\n"
+        )
+        assert file_contains_secrets(big) is True
+
+    def test_secret_across_chunk_boundary_detected(self, tmp_path):
+        big = tmp_path / "dump.txt"
+        big.write_bytes(
+            b"x" * (SCAN_CHUNK_SIZE - 10)
+            + b" gsk_aB1cD2eF3gH4iJ5kL6mN7oP8qR9sT0uV1wX2yZ3aB4cD5eF6gH7\n"
+        )
+        assert file_contains_secrets(big) is True
+
 
 class TestCollectFiles:
     """Tests for file collection logic."""
@@ -155,6 +181,29 @@ class TestCollectFiles:
 
         assert not any("__pycache__" in name for name in arcnames)
 
+    def test_collected_paths_pass_should_exclude_path(self, tmp_path):
+        src_dir = tmp_path / "src"
+        (src_dir / "pkg" / ".git").mkdir(parents=True)
+        (src_dir / "pkg" / ".git" / "HEAD").write_text("ref: main")
+        (src_dir / "pkg" / "logs").write_text("")
+        (src_dir / "pkg" / "mod.py").write_text("")
+
+        arcnames = [arcname for _, arcname in collect_files(tmp_path)]
+
+        assert arcnames == ["src/pkg/mod.py"]
+        assert not any(should_exclude_path(Path(name)) for name in arcnames)
+
+    def test_prunes_nested_excluded_dirs_and_env_files(self, tmp_path):
+        src_dir = tmp_path / "src"
+        (src_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (src_dir / "node_modules" / "pkg" / "index.js").write_text("")
+        (src_dir / ".env").write_text("TOKEN=placeholder")
+        (src_dir / "app.py").write_text("print('app')")
+
+        arcnames = [arcname for _, arcname in collect_files(tmp_path)]
+
+        assert arcnames == ["src/app.py"]
+
     def test_collects_project_files(self, tmp_path):
         (tmp_path / "pyproject.toml").write_text("[project]\nname='test'")
         (tmp_path / "README.md").write_text("# Test")
@@ -304,3 +353,92 @@ class TestCloneExporter:
             assert not any("leaked.py" in name for name in names)
             # clean.py should be in the archive
             assert any("clean.py" in name for name in names)
+
+    def test_export_parallel_scan_excludes_secrets(self, tmp_path):
+        """Large trees are scanned in a process pool with the same result."""
+        project = tmp_path / "project"
+        src_dir = project / "src"
+        src_dir.mkdir(parents=True)
+        for i in range(PARALLEL_SCAN_MIN_FILES + 8):
+            (src_dir / f"module_{i:03d}.py").write_text(f"VALUE = {i}\n")
+        (src_dir / "leaked.py").write_text(
+            'API_KEY = "gsk_aB1cD2eF3gH4iJ5kL6mN7oP8qR9sT0uV1wX2yZ3aB4cD5eF6gH7"'
+        )
+
+        output = tmp_path / "output.tar.gz"
+        CloneExporter(str(project)).export(str(output))
+
+        with tarfile.open(str(output), "r:gz") as tar:
+            names = tar.getnames()
+            assert not any("leaked.py" in name for name in names)
+            assert sum("module_" in name for name in names) == PARALLEL_SCAN_MIN_FILES + 8
+
+    def test_export_preserves_file_mode(self, tmp_path):
+        project = tmp_path / "project"
+        project.mkdir()
+        start = project / "start"
+        start.write_text("#!/bin/bash\necho start\n")
+        start.chmod(0o755)
+
+        output = tmp_path / "output.tar.gz"
+        CloneExporter(str(project)).export(str(output))
+
+        with tarfile.open(str(output), "r:gz") as tar:
+            member = tar.getmember("openclaw/start")
+            assert member.mode == 0o755
+            assert member.size == start.stat().st_size
+
+    def test_export_with_external_compressor(self, tmp_path, monkeypatch):
+        """When pigz is on PATH the archive is piped through it (gzip stands in)."""
+        gzip_path = shutil.which("gzip")
+        if gzip_path is None:
+            pytest.skip("gzip binary not available")
+        monkeypatch.setattr(shutil, "which", lambda name: gzip_path)
+
+        project = tmp_path / "project"
+        src_dir = project / "src"
+        src_dir.mkdir(parents=True)
+        (src_dir / "main.py").write_text("print('hello')\n")
+
+        output = tmp_path / "output.tar.gz"
+        CloneExporter(str(project)).export(str(output))
+
+        with tarfile.open(str(output), "r:gz") as tar:
+            names = tar.getnames()
+            assert "openclaw/src/main.py" in names
+            assert "openclaw/config/.env.template" in names
+
+    def test_export_rejects_tainted_member_in_stream(self, tmp_path, monkeypatch):
+        """A secret slipping into a written member aborts and removes the archive."""
+        import scripts.clone as clone
+
+        monkeypatch.setattr(
+            clone,
+            "ENV_TEMPLATE_CONTENT",
+            "GROQ_API_KEY=gsk_aB1cD2eF3gH4iJ5kL6mN7oP8qR9sT0uV1wX2yZ3aB4cD5eF6gH7\n",
+        )
+        project = tmp_path / "project"
+        project.mkdir()
+
+        output = tmp_path / "output.tar.gz"
+        with pytest.raises(RuntimeError, match="config/.env.template"):
+            CloneExporter(str(project)).export(str(output))
+
+        assert not output.exists()
+
+    def test_export_excludes_binary_files_with_secrets(self, tmp_path):
+        """Binary types are scanned like text ones and left out if they match."""
+        project = tmp_path / "project"
+        (project / "assets").mkdir(parents=True)
+        (project / "assets" / "logo.png").write_text(
+            "gsk_aB1cD2eF3gH4iJ5kL6mN7oP8qR9sT0uV1wX2yZ3aB4cD5eF6gH7"
+        )
+        (project / "assets" / "notes.txt").write_text("plain notes\n")
+
+        output = tmp_path / "output.tar.gz"
+        CloneExporter(str(project)).export(str(output))
+
+        with tarfile.open(output) as tar:
+            names = tar.getnames()
+        assert "openclaw/assets/notes.txt" in names
+        assert "openclaw/assets/logo.png" not in names
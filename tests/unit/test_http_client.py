@@ -0,0 +1,40 @@
+"""Unit tests for the shared skill HTTP client."""
+
+import asyncio
+
+import pytest
+
+from src.skills import http_client
+
+
+@pytest.fixture(autouse=True)
+async def reset_client():
+    yield
+    await http_client.close_http_client()
+
+
+class TestSharedClient:
+    async def test_reused_across_calls(self):
+        assert http_client.get_http_client() is http_client.get_http_client()
+
+    async def test_recreated_after_close(self):
+        client = http_client.get_http_client()
+
+        await http_client.close_http_client()
+
+        assert client.is_closed
+        assert http_client.get_http_client() is not client
+
+    def test_new_client_per_event_loop(self):
+        async def get():
+            client = http_client.get_http_client()
+            await asyncio.sleep(0)
+            return client
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+
+        assert first is not second
+        # The client from the finished loop was closed, not just dropped
+        assert first.is_closed
+        assert not second.is_closed
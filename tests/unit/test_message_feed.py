@@ -4,7 +4,7 @@ Tests Task 7.1: MessageRecord dataclass and message feed with 100-record cap.
 Requirements: 5.1, 5.6
 """
 
-from src.web.dashboard import DashboardState, MessageRecord
+from src.web.dashboard import DashboardState, MessageRecord, UniqueCounter
 
 
 class TestMessageRecord:
@@ -56,3 +56,35 @@ class TestMessageFeed:
         # Oldest should be user5 (indices 5-104 survive)
         assert state.message_feed[0].username == "user5"
         assert state.message_feed[-1].username == "user104"
+
+
+class TestRecentActivity:
+    def test_cap_keeps_most_recent_50(self):
+        state = DashboardState()
+        for i in range(60):
+            state.add_activity("message", f"msg-{i}")
+        assert len(state.recent_activity) == 50
+        assert state.recent_activity[0]["text"] == "msg-10"
+
+    def test_to_dict_returns_last_10(self):
+        state = DashboardState()
+        for i in range(20):
+            state.add_activity("message", f"msg-{i}")
+        recent = state.to_dict()["recent_activity"]
+        assert [a["text"] for a in recent] == [f"msg-{i}" for i in range(10, 20)]
+
+
+class TestUniqueCounter:
+    def test_small_counts_exact_and_duplicates_ignored(self):
+        counter = UniqueCounter()
+        counter.update([1, 2, 3, 2, 1])
+        counter.add(3)
+        assert len(counter) == 3
+
+    def test_empty(self):
+        assert len(UniqueCounter()) == 0
+
+    def test_large_count_within_tolerance(self):
+        counter = UniqueCounter()
+        counter.update(range(100_000))
+        assert abs(len(counter) - 100_000) < 5_000
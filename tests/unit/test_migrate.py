@@ -11,6 +11,9 @@ from scripts.migrate import (
     MigrationManager,
     compute_sha256,
     compute_file_sha256,
+    compute_stream_sha256,
+    dump_manifest,
+    load_manifest,
 )
 
 
@@ -34,6 +37,20 @@ class TestComputeSha256:
         f.write_bytes(b"test content")
         assert compute_file_sha256(f) == compute_sha256(b"test content")
 
+    def test_stream_sha256(self):
+        data = b"streamed content" * 1000
+        assert compute_stream_sha256(io.BytesIO(data)) == compute_sha256(data)
+
+
+class TestManifestSerialization:
+    """Tests for manifest JSON round-tripping."""
+
+    def test_round_trip(self):
+        manifest = {"timestamp": "2024-01-01T00:00:00", "version": "1.0", "files": {"a": "b"}}
+        data = dump_manifest(manifest)
+        assert isinstance(data, bytes)
+        assert load_manifest(data) == manifest
+
 
 def _create_project(tmp_path: Path) -> Path:
     """Create a minimal project structure for testing.
@@ -137,6 +154,47 @@ class TestMigrationManagerBackup:
             env_files = [n for n in names if n.endswith(".env")]
             assert len(env_files) == 0
 
+    def test_backup_many_logs_in_order(self, tmp_path):
+        project = _create_project(tmp_path)
+        logs_dir = project / "logs"
+        for i in range(40):
+            (logs_dir / f"bot-{i:02d}.log").write_bytes(f"entry {i}\n".encode() * (i + 1))
+        output = tmp_path / "backup.tar.gz"
+
+        manager = MigrationManager(str(project))
+        manager.backup(str(output))
+
+        with tarfile.open(str(output), "r:gz") as tar:
+            logs = [m for m in tar.getmembers() if "/logs/" in m.name]
+            assert [m.name for m in logs] == sorted(m.name for m in logs)
+            for member in logs:
+                data = tar.extractfile(member).read()
+                expected = (project / member.name.split("/", 1)[1]).read_bytes()
+                assert data == expected
+
+        assert manager.validate_integrity(output) == []
+
+    def test_backup_more_spilled_files_than_fd_limit(self, tmp_path, monkeypatch):
+        resource = pytest.importorskip("resource")
+        import scripts.migrate as migrate
+
+        project = _create_project(tmp_path)
+        logs_dir = project / "logs"
+        for i in range(300):
+            (logs_dir / f"bot-{i:03d}.log").write_bytes(f"entry {i}\n".encode() * 50)
+        output = tmp_path / "backup.tar.gz"
+
+        # Spill every snapshot, with fewer descriptors allowed than files
+        monkeypatch.setattr(migrate, "SNAPSHOT_MEMORY_BUDGET", 0)
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(256, hard), hard))
+        try:
+            MigrationManager(str(project)).backup(str(output))
+        finally:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+        assert MigrationManager(str(project)).validate_integrity(output) == []
+
     def test_backup_generates_env_template(self, tmp_path):
         project = _create_project(tmp_path)
         output = tmp_path / "backup.tar.gz"
@@ -180,6 +238,18 @@ class TestMigrationManagerBackup:
                     assert "data/contexts.json" in manifest["files"]
                     break
 
+    def test_backup_manifest_is_first_member(self, tmp_path):
+        project = _create_project(tmp_path)
+        output = tmp_path / "backup.tar.gz"
+
+        MigrationManager(str(project)).backup(str(output))
+
+        with tarfile.open(str(output), "r|gz") as tar:
+            first = next(iter(tar))
+            assert first.name == "openclaw-backup/manifest.json"
+            manifest = json.loads(tar.extractfile(first).read())
+            assert "config/.env.template" in manifest["files"]
+
     def test_backup_manifest_checksums_are_valid(self, tmp_path):
         project = _create_project(tmp_path)
         output = tmp_path / "backup.tar.gz"
@@ -228,6 +298,17 @@ class TestMigrationManagerBackup:
 
         assert result.exists()
 
+    def test_version_read_from_project_table(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.other]\nversion_info = "9"\nversion = "9.9.9"\n\n'
+            '[project]\nname = "x"\nversion = "1.2.3"\n'
+        )
+        manager = MigrationManager(str(tmp_path))
+        assert manager._get_version() == "1.2.3"
+
+    def test_version_unknown_without_pyproject(self, tmp_path):
+        assert MigrationManager(str(tmp_path))._get_version() == "unknown"
+
     def test_backup_default_output_path(self, tmp_path):
         project = _create_project(tmp_path)
         manager = MigrationManager(str(project))
@@ -397,6 +478,22 @@ class TestMigrationManagerIntegrity:
         with pytest.raises(ValueError, match="No manifest.json"):
             manager.validate_integrity(archive)
 
+    def test_given_manifest_used_for_archive_without_one(self, tmp_path):
+        archive = tmp_path / "no_manifest.tar.gz"
+        content = b"bot: {}"
+        with tarfile.open(str(archive), "w:gz") as tar:
+            info = tarfile.TarInfo(name="openclaw-backup/config/config.yaml")
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+
+        manager = MigrationManager(str(tmp_path))
+        checksums = {"config/config.yaml": compute_sha256(content)}
+        assert manager.validate_integrity(archive, {"files": checksums}) == []
+        # An empty manifest is still a manifest, not a request to read one
+        assert manager.validate_integrity(archive, {}) == [
+            "config/config.yaml: not listed in manifest"
+        ]
+
     def test_restore_rejects_tampered_archive(self, tmp_path):
         project = _create_project(tmp_path)
         archive = tmp_path / "backup.tar.gz"
@@ -427,6 +524,34 @@ class TestMigrationManagerIntegrity:
         with pytest.raises(ValueError, match="Integrity validation failed"):
             restore_manager.restore(str(tampered))
 
+        # Nothing is written before the whole archive has been validated
+        assert list(target.iterdir()) == []
+
+    def test_restore_tampered_archive_keeps_existing_files(self, tmp_path):
+        project = _create_project(tmp_path)
+        archive = tmp_path / "backup.tar.gz"
+        MigrationManager(str(project)).backup(str(archive))
+
+        tampered = tmp_path / "tampered.tar.gz"
+        with tarfile.open(str(archive), "r:gz") as src:
+            with tarfile.open(str(tampered), "w:gz") as dst:
+                for member in src.getmembers():
+                    data = src.extractfile(member).read()
+                    if member.name.endswith("logs/audit.log"):
+                        data = b"TAMPERED"
+                        member.size = len(data)
+                    dst.addfile(member, io.BytesIO(data))
+
+        target = tmp_path / "target"
+        (target / "config").mkdir(parents=True)
+        (target / "config" / "config.yaml").write_text("original: true\n")
+
+        with pytest.raises(ValueError, match="Integrity validation failed"):
+            MigrationManager(str(target)).restore(str(tampered))
+
+        assert (target / "config" / "config.yaml").read_text() == "original: true\n"
+        assert sorted(p.name for p in target.rglob("*")) == ["config", "config.yaml"]
+
 
 class TestBackupRestoreRoundTrip:
     """Tests that backup → restore preserves data."""
@@ -481,3 +606,43 @@ class TestBackupRestoreRoundTrip:
             original = (project / "config" / config_file).read_text()
             restored = (target / "config" / config_file).read_text()
             assert original == restored, f"Mismatch in {config_file}"
+
+    def test_round_trip_zstd_archive(self, tmp_path):
+        pytest.importorskip("zstandard")
+        project = _create_project(tmp_path)
+        archive = tmp_path / "backup.tar.zst"
+
+        manager = MigrationManager(str(project))
+        manager.backup(str(archive))
+        assert archive.read_bytes()[:4] == b"\x28\xb5\x2f\xfd"
+
+        target = tmp_path / "target"
+        target.mkdir()
+        restore_manager = MigrationManager(str(target))
+        result = restore_manager.restore(str(archive))
+
+        assert result["errors"] == []
+        original = json.loads((project / "data" / "contexts.json").read_text())
+        restored = json.loads((target / "data" / "contexts.json").read_text())
+        assert original == restored
+
+    def test_round_trip_uncompressed_archive(self, tmp_path):
+        project = _create_project(tmp_path)
+        log = project / "logs" / "big.log"
+        log.write_bytes(b"x" * (3 * 1024 * 1024 + 17))
+        archive = tmp_path / "backup.tar"
+
+        manager = MigrationManager(str(project))
+        manager.backup(str(archive))
+        with tarfile.open(str(archive), "r:") as tar:
+            assert any(n.endswith("manifest.json") for n in tar.getnames())
+
+        target = tmp_path / "target"
+        target.mkdir()
+        result = MigrationManager(str(target)).restore(str(archive))
+
+        assert result["errors"] == []
+        assert (target / "logs" / "big.log").read_bytes() == log.read_bytes()
+        for config_file in ["config.yaml", "permissions.yaml"]:
+            original = (project / "config" / config_file).read_text()
+            assert (target / "config" / config_file).read_text() == original
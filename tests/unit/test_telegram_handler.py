@@ -0,0 +1,685 @@
+"""Unit tests for TelegramHandler command dispatch, streaming and dashboard updates."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from telegram.error import BadRequest, RetryAfter, TelegramError
+
+from src.bot import telegram_handler
+from src.bot.command_router import CommandRouter
+from src.bot.telegram_handler import TelegramHandler
+from src.security.auth import AuthManager
+from src.utils.context_store import ContextStore
+from src.web.dashboard import DashboardState
+
+
+class FakeProviderManager:
+    """Provider manager that streams fixed chunks with a delay between them."""
+
+    def __init__(self, chunks, delay=0.0, error=None):
+        self.chunks = chunks
+        self.delay = delay
+        self.error = error
+
+    async def stream_with_failover(self, messages, user_id):
+        for chunk in self.chunks:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            yield chunk
+        if self.error:
+            raise self.error
+
+
+def _make_handler(provider_manager, interval_ms=10, min_chars=5):
+    return TelegramHandler(
+        token="test-token",
+        command_router=MagicMock(),
+        auth_manager=MagicMock(),
+        provider_manager=provider_manager,
+        context_store=MagicMock(),
+        streaming_interval_ms=interval_ms,
+        streaming_min_chars=min_chars,
+    )
+
+
+def _make_update():
+    sent_message = MagicMock()
+    sent_message.edit_text = AsyncMock()
+    update = MagicMock()
+    update.message.reply_text = AsyncMock(return_value=sent_message)
+    return update, sent_message
+
+
+class TestStreamResponse:
+    async def test_returns_full_response_and_final_edit(self):
+        handler = _make_handler(FakeProviderManager(["Hello", ", ", "world"]))
+        update, sent_message = _make_update()
+
+        result = await handler._stream_response(update, [], 1)
+
+        assert result == "Hello, world"
+        sent_message.edit_text.assert_awaited_with("Hello, world")
+
+    async def test_intermediate_edits_while_streaming(self):
+        chunks = [f"chunk{i} " for i in range(20)]
+        handler = _make_handler(FakeProviderManager(chunks, delay=0.005))
+        update, sent_message = _make_update()
+
+        result = await handler._stream_response(update, [], 1)
+
+        assert result == "".join(chunks)
+        edits = [c.args[0] for c in sent_message.edit_text.await_args_list]
+        assert len(edits) > 1
+        # Intermediate edits are growing prefixes of the final text
+        for text in edits[:-1]:
+            assert result.startswith(text)
+        assert edits[-1] == result
+
+    async def test_long_response_truncated(self):
+        handler = _make_handler(FakeProviderManager(["x" * 5000]))
+        update, sent_message = _make_update()
+
+        result = await handler._stream_response(update, [], 1)
+
+        assert len(result) == 5000
+        final = sent_message.edit_text.await_args.args[0]
+        assert final.startswith("x" * 4000)
+        assert final.endswith("[Message truncated...]")
+
+    async def test_long_response_truncated_on_word_boundary(self):
+        words = ["word"] * 1000
+        handler = _make_handler(FakeProviderManager([" ".join(words)]))
+        update, sent_message = _make_update()
+
+        await handler._stream_response(update, [], 1)
+
+        final = sent_message.edit_text.await_args.args[0]
+        shown = final.removesuffix("\n\n[Message truncated...]")
+        assert len(shown) <= 4000
+        assert shown.split(" ") == words[: len(shown.split(" "))]
+
+    async def test_stops_editing_once_display_is_full(self):
+        chunks = ["y" * 500] * 20
+        handler = _make_handler(FakeProviderManager(chunks, delay=0.005), interval_ms=5)
+        update, sent_message = _make_update()
+
+        await handler._stream_response(update, [], 1)
+
+        edits = [c.args[0] for c in sent_message.edit_text.await_args_list]
+        # The full 4000-char prefix is sent once, then only the final edit
+        assert edits.count("y" * 4000) == 1
+        assert edits[-1].endswith("[Message truncated...]")
+        assert all(len(text) <= 4000 for text in edits[:-1])
+
+    async def test_final_edit_retried_after_flood_wait(self):
+        handler = _make_handler(FakeProviderManager(["done"]), interval_ms=60_000)
+        update, sent_message = _make_update()
+        sent_message.edit_text.side_effect = [RetryAfter(0), None]
+
+        await handler._stream_response(update, [], 1)
+
+        assert [c.args[0] for c in sent_message.edit_text.await_args_list] == ["done", "done"]
+
+    async def test_final_edit_ignores_not_modified(self):
+        handler = _make_handler(FakeProviderManager(["same"]))
+        update, sent_message = _make_update()
+        sent_message.edit_text.side_effect = BadRequest("Message is not modified")
+
+        assert await handler._stream_response(update, [], 1) == "same"
+
+    async def test_stream_starts_before_placeholder_is_sent(self):
+        events = []
+
+        class RecordingProvider:
+            async def stream_with_failover(self, messages, user_id):
+                events.append("stream")
+                yield "hi"
+
+        handler = _make_handler(RecordingProvider())
+        update, sent_message = _make_update()
+
+        async def slow_reply(text):
+            await asyncio.sleep(0.02)
+            events.append("placeholder")
+            return sent_message
+
+        update.message.reply_text = slow_reply
+
+        assert await handler._stream_response(update, [], 1) == "hi"
+        assert events == ["stream", "placeholder"]
+        sent_message.edit_text.assert_awaited_with("hi")
+
+    async def test_edit_in_flight_lands_before_final_edit(self):
+        events = []
+        handler = _make_handler(FakeProviderManager(["a" * 10, "b" * 10], delay=0.05))
+        update, sent_message = _make_update()
+
+        async def slow_edit(text):
+            events.append(("start", text))
+            await asyncio.sleep(0.1)
+            events.append(("end", text))
+
+        sent_message.edit_text = slow_edit
+
+        await handler._stream_response(update, [], 1)
+
+        # The intermediate edit finishes before the final edit starts
+        assert events == [
+            ("start", "a" * 10),
+            ("end", "a" * 10),
+            ("start", "a" * 10 + "b" * 10),
+            ("end", "a" * 10 + "b" * 10),
+        ]
+
+    async def test_many_small_chunks(self):
+        chunks = ["tok "] * 5000
+        handler = _make_handler(FakeProviderManager(chunks), interval_ms=5)
+        update, sent_message = _make_update()
+
+        result = await handler._stream_response(update, [], 1)
+
+        assert result == "tok " * 5000
+        final = sent_message.edit_text.await_args.args[0]
+        assert final.endswith("[Message truncated...]")
+
+    async def test_final_edit_skipped_when_already_shown(self):
+        class PausingProvider:
+            async def stream_with_failover(self, messages, user_id):
+                yield "hello world"
+                await asyncio.sleep(0.05)
+
+        handler = _make_handler(PausingProvider(), interval_ms=5)
+        update, sent_message = _make_update()
+
+        assert await handler._stream_response(update, [], 1) == "hello world"
+        sent_message.edit_text.assert_awaited_once_with("hello world")
+
+    async def test_no_edit_before_visible_text(self):
+        chunks = ["   ", "\n\n\n\n\n\n", "hi there"]
+        handler = _make_handler(FakeProviderManager(chunks, delay=0.02), interval_ms=5, min_chars=1)
+        update, sent_message = _make_update()
+
+        await handler._stream_response(update, [], 1)
+
+        sent_message.edit_text.assert_awaited_once_with("".join(chunks))
+
+    async def test_whitespace_chunks_not_edited_in(self):
+        chunks = ["hello world", " ", "\n\n", "   ", "\n"]
+        handler = _make_handler(FakeProviderManager(chunks, delay=0.02), interval_ms=5, min_chars=1)
+        update, sent_message = _make_update()
+
+        assert await handler._stream_response(update, [], 1) == "hello world \n\n   \n"
+        sent_message.edit_text.assert_awaited_once_with("hello world")
+
+    async def test_error_shows_partial_response(self):
+        provider = FakeProviderManager(["partial"], error=RuntimeError("boom"))
+        handler = _make_handler(provider)
+        update, sent_message = _make_update()
+
+        result = await handler._stream_response(update, [], 1)
+
+        assert result == "partial"
+        final = sent_message.edit_text.await_args.args[0]
+        assert final.startswith("partial")
+        assert "Response interrupted: boom" in final
+
+    async def test_error_truncates_partial_response_at_word(self):
+        words = ["word "] * 1000
+        provider = FakeProviderManager(words, error=RuntimeError("boom"))
+        handler = _make_handler(provider, min_chars=10_000)
+        update, sent_message = _make_update()
+
+        await handler._stream_response(update, [], 1)
+
+        final = sent_message.edit_text.await_args.args[0]
+        shown, _, note = final.partition("\n\n")
+        assert len(shown) <= telegram_handler.INTERRUPTED_TEXT_LIMIT
+        assert set(shown.split(" ")) == {"word"}
+        assert note == "⚠️ Response interrupted: boom"
+
+
+@pytest.fixture
+def state(monkeypatch):
+    """Fresh dashboard state for the handler module."""
+    fresh = DashboardState()
+    monkeypatch.setattr(telegram_handler, "dashboard_state", fresh)
+    return fresh
+
+
+class TestDashboardUpdates:
+    def test_applied_immediately_when_not_running(self, state):
+        handler = _make_handler(MagicMock())
+
+        handler._publish("message", 1, "message", "@a: hi", "💬")
+
+        assert state.total_messages == 1
+        assert len(state.active_users) == 1
+
+    async def test_batched_while_running(self, state):
+        handler = _make_handler(MagicMock())
+        handler._dash_queue = asyncio.Queue()
+
+        handler._publish("message", 1, "message", "@a: hi", "💬")
+        handler._publish("message", 2, "command", "@b: /help", "⚡")
+        handler._publish("message", 1, "message", "@a: again", "💬")
+        handler._publish("response", "a", "hi", "hello there", 4)
+        handler._publish("record", "b", "/help", "commands")
+        assert state.total_messages == 0
+
+        handler._flush_dashboard()
+
+        assert state.total_messages == 3
+        assert len(state.active_users) == 2
+        assert state.total_tokens == 4
+        assert [a["text"] for a in state.recent_activity] == [
+            "@a: hi", "@b: /help", "@a: again",
+        ]
+        assert [r.user_message for r in state.message_feed] == ["hi", "/help"]
+
+    async def test_full_queue_applied_early(self, state):
+        handler = _make_handler(MagicMock())
+        handler._dash_queue = asyncio.Queue(2)
+
+        for user_id in (1, 2, 3):
+            handler._publish("message", user_id, "message", "hi", "💬")
+
+        # The first two were applied together to make room for the third
+        assert state.total_messages == 2
+        assert handler._dash_queue.qsize() == 1
+
+
+class TestAuthCache:
+    def test_decision_reused_within_ttl(self):
+        handler = _make_handler(MagicMock())
+        handler.auth_manager.is_authorized.return_value = True
+
+        assert handler._is_authorized(7)
+        assert handler._is_authorized(7)
+        assert handler.auth_manager.is_authorized.call_count == 1
+
+    def test_failed_attempt_drops_cached_decision(self):
+        handler = _make_handler(MagicMock())
+        handler.auth_manager.is_authorized.return_value = False
+
+        assert not handler._is_authorized(7)
+        handler._record_failed_attempt(7)
+        assert not handler._is_authorized(7)
+
+        assert handler.auth_manager.is_authorized.call_count == 2
+        handler.auth_manager.record_failed_attempt.assert_called_once_with(7)
+
+    def test_permissions_reload_drops_cached_decisions(self):
+        handler = _make_handler(MagicMock())
+        handler.auth_manager = AuthManager({7: "user"})
+
+        assert handler._is_authorized(7)
+        handler.auth_manager.load_permissions({})
+
+        assert not handler._is_authorized(7)
+
+    async def test_reload_drops_cached_decisions(self):
+        auth_manager = MagicMock()
+        auth_manager.check_permission.return_value = True
+        router = CommandRouter(auth_manager)
+        handler = TelegramHandler(
+            token="test-token",
+            command_router=router,
+            auth_manager=auth_manager,
+            provider_manager=MagicMock(),
+            context_store=MagicMock(),
+        )
+
+        auth_manager.is_authorized.return_value = True
+        assert handler._is_authorized(7)
+        auth_manager.is_authorized.return_value = False
+        await router.route("reload", 1, [])
+
+        assert not handler._is_authorized(7)
+
+
+def _make_command_update(text, user_id=7):
+    update = MagicMock()
+    update.message.text = text
+    update.message.reply_text = AsyncMock()
+    update.effective_user.id = user_id
+    update.effective_user.username = "alice"
+    return update
+
+
+class TestCommandDispatch:
+    @pytest.fixture
+    def handler(self, state):
+        handler = _make_handler(MagicMock())
+        handler.auth_manager.is_authorized.return_value = True
+        handler.command_router.route = AsyncMock(return_value="ok")
+        return handler
+
+    @pytest.fixture
+    def context(self):
+        context = MagicMock()
+        context.bot.username = "ClawBot"
+        return context
+
+    async def test_routes_command_with_args(self, handler, context):
+        update = _make_command_update("/model  groq llama")
+
+        await handler._handle_command(update, context)
+
+        handler.command_router.route.assert_awaited_once_with("model", 7, ["groq", "llama"])
+        update.message.reply_text.assert_awaited_once_with("ok")
+
+    async def test_command_ends_at_any_whitespace(self, handler, context):
+        update = _make_command_update("/model\ngroq\tllama")
+
+        await handler._handle_command(update, context)
+
+        handler.command_router.route.assert_awaited_once_with("model", 7, ["groq", "llama"])
+
+    async def test_strips_own_bot_name(self, handler, context):
+        update = _make_command_update("/help@clawbot")
+
+        await handler._handle_command(update, context)
+
+        handler.command_router.route.assert_awaited_once_with("help", 7, [])
+
+    async def test_ignores_command_for_other_bot(self, handler, context):
+        update = _make_command_update("/help@OtherBot")
+
+        await handler._handle_command(update, context)
+
+        handler.command_router.route.assert_not_awaited()
+        update.message.reply_text.assert_not_awaited()
+
+    async def test_skill_file_uploaded_from_open_handle(self, handler, context, tmp_path):
+        audio = tmp_path / "speech.mp3"
+        audio.write_bytes(b"ID3" + b"\x00" * 64)
+        handler.skill_registry = MagicMock()
+        handler.skill_registry.skills = {"tts": MagicMock()}
+        handler.skill_registry.execute_skill = AsyncMock(
+            return_value=MagicMock(error=None, file_path=str(audio), text="hi")
+        )
+        update = _make_command_update("/tts hi")
+        update.message.reply_audio = AsyncMock()
+
+        await handler._handle_command(update, context)
+
+        upload = update.message.reply_audio.await_args.kwargs["audio"]
+        assert upload.filename == "speech.mp3"
+        # The file is streamed by the HTTP layer, not read into memory
+        assert not isinstance(upload.input_file_content, bytes)
+        assert not audio.exists()
+
+    @pytest.mark.parametrize(
+        ("name", "kind"),
+        [("clip.MP4", "video"), ("song.opus", "audio"), ("report.pdf", "document")],
+    )
+    async def test_skill_file_sent_by_type(self, handler, context, tmp_path, name, kind):
+        path = tmp_path / name
+        path.write_bytes(b"\x00" * 16)
+        handler.skill_registry = MagicMock()
+        handler.skill_registry.skills = {"get": MagicMock()}
+        handler.skill_registry.execute_skill = AsyncMock(
+            return_value=MagicMock(error=None, file_path=str(path), text="")
+        )
+        update = _make_command_update("/get it")
+        for reply in ("reply_video", "reply_audio", "reply_document"):
+            setattr(update.message, reply, AsyncMock())
+
+        await handler._handle_command(update, context)
+
+        getattr(update.message, f"reply_{kind}").assert_awaited_once()
+        assert kind in getattr(update.message, f"reply_{kind}").await_args.kwargs
+
+
+class EchoProviderManager:
+    """Provider manager replying "re: <message>", slowly to the first message."""
+
+    def __init__(self):
+        self.seen = []
+        self.summarized = []
+
+    async def stream_with_failover(self, messages, user_id):
+        self.seen.append(messages)
+        text = messages[-1]["content"]
+        if text == "first":
+            await asyncio.sleep(0.05)
+        yield f"re: {text}"
+
+    async def generate_with_failover(self, messages, user_id):
+        self.summarized.append(messages[-1]["content"])
+        return SimpleNamespace(content=f"summary {len(self.summarized)}")
+
+
+def _make_message_update(text, user_id=7):
+    update = _make_command_update(text, user_id)
+    sent_message = MagicMock()
+    sent_message.edit_text = AsyncMock()
+    update.message.reply_text = AsyncMock(return_value=sent_message)
+    update.message.chat.send_action = AsyncMock()
+    return update
+
+
+class TestConversationTurns:
+    async def test_overlapping_messages_from_one_user_stay_in_order(self, state, tmp_path):
+        provider = EchoProviderManager()
+        handler = _make_handler(provider)
+        handler.context_store = ContextStore(str(tmp_path / "contexts.json"))
+        handler.auth_manager.is_authorized.return_value = True
+
+        await asyncio.gather(
+            handler._handle_message(_make_message_update("first"), MagicMock()),
+            handler._handle_message(_make_message_update("second"), MagicMock()),
+        )
+
+        assert [m["content"] for m in handler.context_store.get_context(7)] == [
+            "first", "re: first", "second", "re: second",
+        ]
+        # The second reply was generated with the first exchange in view
+        assert [m["content"] for m in provider.seen[1][1:]] == [
+            "first", "re: first", "second",
+        ]
+
+    async def test_each_turn_extends_the_previous_prompt(self, state, tmp_path):
+        provider = EchoProviderManager()
+        handler = _make_handler(provider)
+        handler.context_store = ContextStore(str(tmp_path / "contexts.json"))
+        handler.auth_manager.is_authorized.return_value = True
+
+        for text in ("one", "two", "three"):
+            await handler._handle_message(_make_message_update(text), MagicMock())
+
+        # Prompts share a byte-identical prefix (same system message, earlier
+        # turns untouched), so provider-side prompt caches keep hitting
+        for earlier, later in zip(provider.seen, provider.seen[1:]):
+            assert later[: len(earlier)] == earlier
+            assert later[len(earlier)]["content"] == f"re: {earlier[-1]['content']}"
+            assert later[0] is earlier[0]
+
+    async def test_reply_tokens_estimated_from_length(self, state, tmp_path):
+        handler = _make_handler(EchoProviderManager())
+        handler.context_store = ContextStore(str(tmp_path / "contexts.json"))
+        handler.auth_manager.is_authorized.return_value = True
+
+        await handler._handle_message(_make_message_update("hello world"), MagicMock())
+
+        # ~4 characters per token, without splitting the reply into words
+        assert state.total_tokens == len("re: hello world") // 4
+
+    async def test_reply_not_held_up_by_typing_indicator(self, state, tmp_path):
+        handler = _make_handler(EchoProviderManager())
+        handler.context_store = ContextStore(str(tmp_path / "contexts.json"))
+        handler.auth_manager.is_authorized.return_value = True
+        update = _make_message_update("hello")
+        typing_sent = asyncio.Event()
+
+        async def slow_typing(action):
+            await typing_sent.wait()
+            raise TelegramError("timed out")
+
+        update.message.chat.send_action = slow_typing
+
+        await handler._handle_message(update, MagicMock())
+
+        assert len(handler.context_store.get_context(7)) == 2
+        assert len(handler._typing_tasks) == 1
+        typing_sent.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert not handler._typing_tasks
+
+    async def test_messages_over_rate_limit_not_sent_to_provider(self, state, tmp_path):
+        provider = EchoProviderManager()
+        handler = _make_handler(provider)
+        handler.context_store = ContextStore(str(tmp_path / "contexts.json"))
+        handler.auth_manager.is_authorized.return_value = True
+        handler.auth_manager.allow_message.return_value = False
+        update = _make_message_update("hello")
+
+        await handler._handle_message(update, MagicMock())
+
+        assert provider.seen == []
+        assert "too fast" in update.message.reply_text.await_args.args[0]
+
+    async def test_changed_contexts_saved_periodically(self, state, tmp_path, monkeypatch):
+        monkeypatch.setattr(telegram_handler, "CONTEXT_SAVE_INTERVAL", 0.01)
+        handler = _make_handler(EchoProviderManager())
+        handler.context_store = ContextStore(str(tmp_path / "contexts.json"))
+        handler.auth_manager.is_authorized.return_value = True
+        saver = asyncio.create_task(handler._save_contexts())
+
+        await handler._handle_message(_make_message_update("hello"), MagicMock())
+        await asyncio.sleep(0.05)
+        saver.cancel()
+
+        assert not handler.context_store.dirty
+        saved = ContextStore(str(tmp_path / "contexts.json"))
+        saved.load_from_disk()
+        assert saved.get_context(7) == [
+            {"role": "user", "content": "hello"},
+            {"role": "assistant", "content": "re: hello"},
+        ]
+
+    async def test_old_messages_folded_into_a_reused_summary(self, state, tmp_path):
+        provider = EchoProviderManager()
+        handler = _make_handler(provider)
+        handler.context_store = ContextStore(str(tmp_path / "contexts.json"), max_messages=8)
+        handler.auth_manager.is_authorized.return_value = True
+
+        for text in ("one", "two", "three", "four", "five", "six"):
+            await handler._handle_message(_make_message_update(text), MagicMock())
+
+        # The fifth turn would have pushed "one" out; the oldest turns were
+        # summarized instead
+        assert provider.summarized == [
+            "user: one\nassistant: re: one\nuser: two\nassistant: re: two"
+        ]
+        summary = {"role": "system", "content": "Earlier in this conversation: summary 1"}
+        assert provider.seen[4][1] == summary
+        assert [m["content"] for m in provider.seen[4][2:]] == [
+            "three", "re: three", "four", "re: four", "five",
+        ]
+        # The next turn reuses the stored summary rather than summarizing again
+        assert provider.seen[5][: len(provider.seen[4])] == provider.seen[4]
+        assert handler.context_store.get_summary(7) == "summary 1"
+
+    async def test_summarizing_waits_for_a_reply_slot(self, state, tmp_path):
+        provider = EchoProviderManager()
+        handler = _make_handler(provider)
+        handler.context_store = ContextStore(str(tmp_path / "contexts.json"), max_messages=8)
+        handler._inflight = asyncio.Semaphore(1)
+        history = [{"role": "user", "content": str(i)} for i in range(8)]
+
+        async with handler._inflight:
+            fold = asyncio.create_task(handler._fold_history(7, history))
+            await asyncio.sleep(0.01)
+            assert provider.summarized == []
+
+        assert len(await fold) == 4
+        assert len(provider.summarized) == 1
+
+    async def test_history_kept_when_summarizing_fails(self, state, tmp_path):
+        provider = EchoProviderManager()
+        provider.generate_with_failover = AsyncMock(side_effect=RuntimeError("down"))
+        handler = _make_handler(provider)
+        handler.context_store = ContextStore(str(tmp_path / "contexts.json"), max_messages=4)
+        handler.auth_manager.is_authorized.return_value = True
+
+        for text in ("one", "two", "three"):
+            await handler._handle_message(_make_message_update(text), MagicMock())
+
+        assert handler.context_store.get_summary(7) == ""
+        assert [m["content"] for m in provider.seen[2][1:]] == [
+            "one", "re: one", "two", "re: two", "three",
+        ]
+
+
+class TestStart:
+    @pytest.fixture
+    def app(self, monkeypatch):
+        app = MagicMock()
+        app.initialize = AsyncMock()
+        app.start = AsyncMock()
+        app.updater.start_polling = AsyncMock()
+        app.updater.start_webhook = AsyncMock()
+        application = MagicMock()
+        token = application.builder.return_value.token.return_value
+        app.concurrent = token.concurrent_updates.return_value
+        builder = app.concurrent.http_version.return_value
+        builder.base_url.return_value = builder
+        builder.base_file_url.return_value = builder
+        builder.build.return_value = app
+        monkeypatch.setattr(telegram_handler, "Application", application)
+        app.builder = builder
+        return app
+
+    async def test_polls_by_default(self, app):
+        handler = _make_handler(MagicMock())
+
+        await handler.start()
+        handler._dash_task.cancel()
+        handler._save_task.cancel()
+
+        app.updater.start_polling.assert_awaited_once_with(
+            timeout=30, allowed_updates=["message"]
+        )
+        app.updater.start_webhook.assert_not_awaited()
+        app.builder.base_url.assert_not_called()
+        app.concurrent.http_version.assert_called_once_with(telegram_handler.HTTP_VERSION)
+
+    async def test_webhook_and_local_api_server(self, app):
+        handler = _make_handler(MagicMock())
+        handler.webhook_url = "https://bot.example.com/hook"
+        handler.webhook_secret = "s3cret"
+        handler.api_base_url = "http://localhost:8081/bot"
+
+        await handler.start()
+        handler._dash_task.cancel()
+        handler._save_task.cancel()
+
+        app.updater.start_polling.assert_not_awaited()
+        app.updater.start_webhook.assert_awaited_once_with(
+            listen="0.0.0.0",
+            port=8443,
+            url_path="hook",
+            webhook_url="https://bot.example.com/hook",
+            secret_token="s3cret",
+            allowed_updates=["message"],
+        )
+        app.builder.base_url.assert_called_once_with("http://localhost:8081/bot")
+        app.builder.base_file_url.assert_called_once_with("http://localhost:8081/file/bot")
+
+    async def test_one_handler_for_all_commands(self, app):
+        handler = _make_handler(MagicMock())
+        handler.command_router.handlers = {f"cmd{i}": MagicMock() for i in range(50)}
+
+        await handler.start()
+        handler._dash_task.cancel()
+        handler._save_task.cancel()
+
+        # Commands are looked up in the router, not matched by PTB one by one
+        registered = [c.args[0] for c in app.add_handler.call_args_list]
+        assert len(registered) == 2
+        assert registered[0].filters is telegram_handler.COMMAND_MESSAGES
+        assert registered[0].callback == handler._handle_command
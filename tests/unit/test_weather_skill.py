@@ -57,12 +57,10 @@ class TestWeatherSkillExecute:
     @pytest.mark.asyncio
     async def test_timeout_returns_temporarily_unavailable(self, skill):
         """Timeout errors should return 'Weather service temporarily unavailable'."""
-        with patch("src.skills.weather.httpx.AsyncClient") as mock_client_cls:
+        with patch("src.skills.weather.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.get.side_effect = httpx.TimeoutException("timed out")
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await skill.execute(user_id=1, args=["London"])
             assert result.error == "Weather service temporarily unavailable"
@@ -70,16 +68,14 @@ class TestWeatherSkillExecute:
     @pytest.mark.asyncio
     async def test_http_error_includes_status_code(self, skill):
         """HTTP errors should include the status code in the message."""
-        with patch("src.skills.weather.httpx.AsyncClient") as mock_client_cls:
+        with patch("src.skills.weather.get_http_client") as mock_get_client:
             mock_response = httpx.Response(
                 status_code=500,
                 request=httpx.Request("GET", "https://wttr.in/London?format=j1"),
             )
             mock_client = AsyncMock()
             mock_client.get.return_value = mock_response
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await skill.execute(user_id=1, args=["London"])
             assert result.error is not None
@@ -88,16 +84,14 @@ class TestWeatherSkillExecute:
     @pytest.mark.asyncio
     async def test_http_404_returns_location_not_found(self, skill):
         """404 errors should return 'Location not found'."""
-        with patch("src.skills.weather.httpx.AsyncClient") as mock_client_cls:
+        with patch("src.skills.weather.get_http_client") as mock_get_client:
             mock_response = httpx.Response(
                 status_code=404,
                 request=httpx.Request("GET", "https://wttr.in/Xyzzy?format=j1"),
             )
             mock_client = AsyncMock()
             mock_client.get.return_value = mock_response
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await skill.execute(user_id=1, args=["Xyzzy"])
             assert result.error is not None
@@ -106,12 +100,10 @@ class TestWeatherSkillExecute:
     @pytest.mark.asyncio
     async def test_connect_error_returns_network_message(self, skill):
         """Network connection errors should return a descriptive message."""
-        with patch("src.skills.weather.httpx.AsyncClient") as mock_client_cls:
+        with patch("src.skills.weather.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.get.side_effect = httpx.ConnectError("connection refused")
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await skill.execute(user_id=1, args=["London"])
             assert result.error is not None
@@ -122,7 +114,7 @@ class TestWeatherSkillExecute:
         """Successful response should return formatted weather text."""
         import json
 
-        with patch("src.skills.weather.httpx.AsyncClient") as mock_client_cls:
+        with patch("src.skills.weather.get_http_client") as mock_get_client:
             mock_response = httpx.Response(
                 status_code=200,
                 request=httpx.Request("GET", "https://wttr.in/London?format=j1"),
@@ -131,9 +123,7 @@ class TestWeatherSkillExecute:
 
             mock_client = AsyncMock()
             mock_client.get.return_value = mock_response
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await skill.execute(user_id=1, args=["London"])
             assert result.error is None
@@ -146,16 +136,14 @@ class TestWeatherSkillExecute:
 
     @pytest.mark.asyncio
     async def test_client_uses_15s_timeout_and_follow_redirects(self, skill):
-        """Verify the httpx client is created with timeout=15 and follow_redirects=True."""
-        with patch("src.skills.weather.httpx.AsyncClient") as mock_client_cls:
+        """Verify the request is made with timeout=15 and follow_redirects=True."""
+        with patch("src.skills.weather.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.get.side_effect = httpx.TimeoutException("timed out")
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             await skill.execute(user_id=1, args=["London"])
 
-            mock_client_cls.assert_called_once_with(
-                timeout=15, follow_redirects=True
-            )
+            _, kwargs = mock_client.get.call_args
+            assert kwargs["timeout"] == 15
+            assert kwargs["follow_redirects"] is True